@@ -8,6 +8,8 @@ Human-in-the-loop (검토/승인) 워크플로우가 포함되어 있습니다.
 import os
 import uuid
 import logging
+import functools
+import concurrent.futures
 from typing import Dict, Any, Optional
 import sys
 from langgraph.graph import StateGraph, END
@@ -208,31 +210,33 @@ def analyze_node(state: NewsAgentState) -> Dict[str, Any]:
         and cb.get("failure_threshold", 0) > 0
     )
 
-    # Analyze sentiment with error handling
+    # 감성 분석(LLM 호출)과 키워드 추출은 서로 독립적이므로 동시에 실행
     result_sentiment = PartialResult(status=CompletionStatus.FULL)
-    sentiment_results = safe_api_call(
-        "analyze_sentiment",
-        analyze_sentiment,
-        items=state.normalized,
-        fallback_value={"positive": 0, "neutral": 0, "negative": 0},
-        result_container=result_sentiment,
-        retry_policy=rp,
-        timeout_seconds=timeout_s,
-        raise_on_fail=strict,
-    )
-
-    # Extract keywords with error handling
     result_keywords = PartialResult(status=CompletionStatus.FULL)
-    keyword_results = safe_api_call(
-        "extract_keywords",
-        extract_keywords,
-        items=state.normalized,
-        fallback_value={"top_keywords": [], "total_unique_keywords": 0},
-        result_container=result_keywords,
-        retry_policy=rp,
-        timeout_seconds=timeout_s,
-        raise_on_fail=strict,
-    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
+        sentiment_future = ex.submit(
+            safe_api_call,
+            "analyze_sentiment",
+            analyze_sentiment,
+            items=state.normalized,
+            fallback_value={"positive": 0, "neutral": 0, "negative": 0},
+            result_container=result_sentiment,
+            retry_policy=rp,
+            timeout_seconds=timeout_s,
+            raise_on_fail=strict,
+        )
+
+        keyword_results = safe_api_call(
+            "extract_keywords",
+            extract_keywords,
+            items=state.normalized,
+            fallback_value={"top_keywords": [], "total_unique_keywords": 0},
+            result_container=result_keywords,
+            retry_policy=rp,
+            timeout_seconds=timeout_s,
+            raise_on_fail=strict,
+        )
+        sentiment_results = sentiment_future.result()
 
     analysis = {
         "sentiment": sentiment_results,
@@ -627,6 +631,16 @@ def build_graph(checkpointer: Optional[Any] = None):
     return compiled_graph
 
 
+@functools.lru_cache(maxsize=1)
+def get_default_graph():
+    """
+    체크포인터 없는 컴파일 그래프 (프로세스당 한 번만 빌드)
+
+    노드/엣지 구성이 고정이라 매 실행마다 StateGraph를 다시 컴파일할 필요가 없습니다.
+    """
+    return build_graph(checkpointer=None)
+
+
 def run_agent(
     query: str,
     time_window: str = "7d",
@@ -746,6 +760,8 @@ def run_agent(
         from src.agents.news_trend.graph_advanced import build_advanced_graph
 
         graph = build_advanced_graph()
+    elif checkpointer is None:
+        graph = get_default_graph()
     else:
         graph = build_graph(checkpointer=checkpointer)
     config = {"configurable": {"thread_id": run_id}}
@@ -255,10 +255,11 @@ async def parallel_analyze_node(state: NewsAgentState) -> Dict[str, Any]:
         and cb.get("failure_threshold", 0) > 0
     )
 
-    # Define async wrappers
+    # Define async wrappers (sync calls run in worker threads so gather actually overlaps them)
     async def analyze_sentiment_async():
         """Async wrapper for sentiment analysis"""
-        return safe_api_call(
+        return await asyncio.to_thread(
+            safe_api_call,
             "analyze_sentiment",
             analyze_sentiment,
             items=state.normalized,
@@ -270,7 +271,8 @@ async def parallel_analyze_node(state: NewsAgentState) -> Dict[str, Any]:
 
     async def extract_keywords_async():
         """Async wrapper for keyword extraction"""
-        return safe_api_call(
+        return await asyncio.to_thread(
+            safe_api_call,
             "extract_keywords",
             extract_keywords,
             items=state.normalized,
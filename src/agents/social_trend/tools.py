@@ -7,6 +7,8 @@ from __future__ import annotations
 import time
 import re
 import json
+import heapq
+from operator import itemgetter
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 import logging
@@ -263,15 +265,24 @@ def _analyze_sentiment_llm(texts: List[str]) -> Dict[str, Any]:
     return result
 
 
+# 부분 문자열 매칭용 어휘 (순회 순서가 top_keywords 동률 순서를 정하므로 tuple 유지)
+_POSITIVE_TOKENS = ("great", "good", "love", "추천", "만족", "좋")
+_NEGATIVE_TOKENS = ("bad", "hate", "불만", "나쁨", "싫", "문제")
+
+
 def _analyze_sentiment_keyword(texts: List[str]) -> Dict[str, Any]:
     """키워드 기반 분석 (폴백)"""
-    positive_tokens = ["great", "good", "love", "추천", "만족", "좋"]
-    negative_tokens = ["bad", "hate", "불만", "나쁨", "싫", "문제"]
+    positive_tokens = _POSITIVE_TOKENS
+    negative_tokens = _NEGATIVE_TOKENS
 
     pos = neg = neu = 0
     freq: Dict[str, int] = {}
-    for t in texts:
-        lt = (t or "").lower()
+    # 텍스트당 한 번만 소문자화 (여러 어휘 목록이 같은 버퍼를 공유)
+    lowered = [t.lower() if t else "" for t in texts]
+    for lt in lowered:
+        if not lt:
+            neu += 1
+            continue
         score = 0
         for tok in positive_tokens:
             if tok in lt:
@@ -289,7 +300,7 @@ def _analyze_sentiment_keyword(texts: List[str]) -> Dict[str, Any]:
             neu += 1
 
     total = max(1, pos + neg + neu)
-    top_keywords = sorted(freq.items(), key=lambda x: x[1], reverse=True)[:10]
+    top_keywords = heapq.nlargest(10, freq.items(), key=itemgetter(1))
     return {
         "sentiment": {
             "positive": pos,
@@ -8,8 +8,9 @@ asyncio.run_coroutine_threadsafe()로 이벤트를 발행합니다.
 
 import asyncio
 import logging
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 
 from src.api.streaming import stream_manager, StreamEvent
 
@@ -94,6 +95,36 @@ def _extract_preview(node_name: str, output: Any) -> Dict[str, Any]:
     return preview
 
 
+def _make_threadsafe_emitter(
+    task_id: str, loop: asyncio.AbstractEventLoop
+) -> Callable[[StreamEvent], None]:
+    """
+    워커 스레드용 emit 함수를 한 번만 구성
+
+    이벤트는 스레드 측 버퍼에 쌓이고, 버퍼가 비어 있던 경우에만 루프에 drain을
+    예약합니다. 연달아 발생한 이벤트는 한 번의 emit_many()로 순서대로 발행됩니다.
+    """
+    pending: List[StreamEvent] = []
+    lock = threading.Lock()
+    emit_many = stream_manager.emit_many
+
+    def _drain() -> None:
+        with lock:
+            batch = pending[:]
+            pending.clear()
+        if batch:
+            loop.create_task(emit_many(task_id, batch))
+
+    def _emit(se: StreamEvent) -> None:
+        with lock:
+            schedule = not pending
+            pending.append(se)
+        if schedule:
+            loop.call_soon_threadsafe(_drain)
+
+    return _emit
+
+
 def _run_graph_stream_sync(
     task_id: str,
     agent_name: str,
@@ -108,9 +139,13 @@ def _run_graph_stream_sync(
     ThreadPoolExecutor에서 실행됩니다.
     """
     node_order = AGENT_NODE_ORDER.get(agent_name, [])
+    # node -> 1-based position (one dict lookup per node instead of list.index)
+    node_index = {name: i for i, name in enumerate(node_order, start=1)}
     total_nodes = len(node_order)
     completed_count = 0
-    final_state = {}
+    final_state: Dict[str, Any] = {}
+    update_state = final_state.update
+    emit = _make_threadsafe_emitter(task_id, loop)
 
     try:
         for event in graph.stream(initial_state, config=config):
@@ -123,9 +158,7 @@ def _run_graph_stream_sync(
                     continue
 
                 completed_count += 1
-                index = completed_count
-                if node_name in node_order:
-                    index = node_order.index(node_name) + 1
+                index = node_index.get(node_name, completed_count)
 
                 preview = _extract_preview(node_name, output)
                 label = NODE_LABELS.get(node_name, node_name)
@@ -143,22 +176,18 @@ def _run_graph_stream_sync(
                 )
 
                 # Emit event to async stream manager from sync thread
-                asyncio.run_coroutine_threadsafe(
-                    stream_manager.emit(task_id, se), loop
-                )
+                emit(se)
 
                 # Track final state
                 if isinstance(output, dict):
-                    final_state.update(output)
+                    update_state(output)
 
     except Exception as e:
         se = StreamEvent(
             event="error",
             data={"error": str(e)},
         )
-        asyncio.run_coroutine_threadsafe(
-            stream_manager.emit(task_id, se), loop
-        )
+        emit(se)
         raise
 
     return final_state
@@ -195,7 +224,7 @@ async def run_agent_with_streaming(
     try:
         # Try streaming approach: build graph and use stream()
         if agent_name == "news_trend_agent":
-            from src.agents.news_trend.graph import build_graph
+            from src.agents.news_trend.graph import get_default_graph
             from src.core.state import NewsAgentState
             import uuid
 
@@ -211,7 +240,7 @@ async def run_agent_with_streaming(
                 error=None,
             )
 
-            graph = build_graph(checkpointer=None)
+            graph = get_default_graph()
             config = {"configurable": {"thread_id": run_id}}
 
             # Run graph.stream() in thread pool
@@ -18,6 +18,7 @@ from src.agents.viral_video.tools import (
     detect_spike,
     topic_cluster,
     generate_success_factors,
+    _to_soa,
 )
 from src.core.gateway import route_request
 from src.core.planning.plan import (
@@ -166,10 +167,13 @@ def analyze_node(state: ViralAgentState) -> Dict[str, Any]:
 
     result_container = PartialResult(status=CompletionStatus.FULL)
 
+    # Extract views/titles once and share them between the analysis passes
+    soa = _to_soa(state.normalized)
+
     spike_results = safe_api_call(
         "detect_spike",
         detect_spike,
-        items=state.normalized,
+        items=soa,
         threshold=state.spike_threshold,
         fallback_value={"spike_videos": [], "threshold": state.spike_threshold},
         result_container=result_container,
@@ -181,7 +185,7 @@ def analyze_node(state: ViralAgentState) -> Dict[str, Any]:
     cluster_results = safe_api_call(
         "topic_cluster",
         topic_cluster,
-        state.normalized,
+        soa,
         fallback_value={"top_clusters": [], "total_clusters": 0},
         result_container=result_container,
         retry_policy=rp,
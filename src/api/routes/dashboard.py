@@ -23,7 +23,6 @@ from starlette.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Optional, Tuple
 import asyncio
-import json
 from datetime import datetime
 import logging
 
@@ -40,7 +39,7 @@ from src.infrastructure.storage.async_redis_cache import (
 from src.domain.models import Insight, InsightSource, INSIGHT_REPOSITORY, MISSION_REPOSITORY
 from src.domain.models import save_insight_from_result
 from src.domain.mission import generate_missions_from_insight, recommend_creators_for_mission
-from src.api.routes.n8n import router as n8n_router
+from src.api.routes.n8n import router as n8n_router, close_notify_client
 from src.api.routes.mcp_routes import router as mcp_router
 from src.api.routes.auth_router import router as auth_router
 
@@ -347,6 +346,8 @@ async def shutdown_event():
         await executor.stop()
         logger.info("Distributed executor stopped")
 
+    await close_notify_client()
+
 
 # ============================================================================
 # API 엔드포인트
@@ -591,12 +592,12 @@ async def stream_task(task_id: str):
     from src.api.streaming import stream_manager
 
     async def event_generator():
-        async for event in stream_manager.subscribe(task_id):
-            if event.event == "keepalive":
-                yield ": keepalive\n\n"
-            else:
-                data = json.dumps(event.to_dict(), ensure_ascii=False)
-                yield f"event: {event.event}\ndata: {data}\n\n"
+        # 한 번에 도착한 이벤트 묶음은 하나의 청크로 전송
+        async for batch in stream_manager.subscribe_batches(task_id):
+            yield b"".join(
+                b": keepalive\n\n" if event.event == "keepalive" else event.to_sse()
+                for event in batch
+            )
 
     return StreamingResponse(
         event_generator(),
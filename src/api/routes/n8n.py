@@ -17,10 +17,19 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
+import httpx
+
 from src.infrastructure.storage.async_redis_cache import get_async_cache
 
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401  (httpx HTTP/2 지원)
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 router = APIRouter(prefix="/n8n", tags=["n8n Automation"])
 
 # Redis-based task storage with TTL (24 hours)
@@ -455,10 +464,37 @@ async def _process_webhook_result(task_id: str, payload: Dict[str, Any]) -> None
 # Helper Functions
 # ============================================================================
 
+_notify_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_notify_client() -> httpx.AsyncClient:
+    """
+    알림 전송용 공유 HTTP 클라이언트
+
+    호출마다 세션을 만들면 TCP/TLS 연결을 매번 새로 맺으므로 keep-alive 풀을 재사용하고,
+    h2가 설치되어 있으면 같은 호스트(Slack 등)로의 요청을 HTTP/2로 멀티플렉싱합니다.
+    """
+    global _notify_client
+    if _notify_client is None or _notify_client.is_closed:
+        _notify_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+    return _notify_client
+
+
+async def close_notify_client() -> None:
+    """공유 알림 클라이언트 종료 (앱 종료 시)"""
+    global _notify_client
+    client, _notify_client = _notify_client, None
+    if client is not None:
+        await client.aclose()
+
 
 async def send_slack_notification(result: Dict[str, Any], request: N8NAgentRequest):
     """Slack 알림 전송"""
-    import aiohttp
     import os
 
     slack_webhook = os.getenv("SLACK_WEBHOOK_URL")
@@ -480,12 +516,11 @@ async def send_slack_notification(result: Dict[str, Any], request: N8NAgentReque
             ],
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(slack_webhook, json=message) as response:
-                if response.status == 200:
-                    logger.info("[n8n] Slack notification sent")
-                else:
-                    logger.error(f"[n8n] Slack notification failed: {response.status}")
+        response = await _get_notify_client().post(slack_webhook, json=message)
+        if response.status_code == 200:
+            logger.info("[n8n] Slack notification sent")
+        else:
+            logger.error(f"[n8n] Slack notification failed: {response.status_code}")
 
     except Exception as e:
         logger.error(f"[n8n] Error sending Slack notification: {e}")
@@ -493,8 +528,6 @@ async def send_slack_notification(result: Dict[str, Any], request: N8NAgentReque
 
 async def send_webhook_notification(result: Dict[str, Any], request: N8NAgentRequest):
     """커스텀 Webhook으로 결과 전송"""
-    import aiohttp
-
     if not request.notify_webhook:
         return
 
@@ -506,12 +539,11 @@ async def send_webhook_notification(result: Dict[str, Any], request: N8NAgentReq
             "timestamp": datetime.now().isoformat(),
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(request.notify_webhook, json=payload) as response:
-                if response.status == 200:
-                    logger.info(f"[n8n] Webhook notification sent to {request.notify_webhook}")
-                else:
-                    logger.error(f"[n8n] Webhook notification failed: {response.status}")
+        response = await _get_notify_client().post(request.notify_webhook, json=payload)
+        if response.status_code == 200:
+            logger.info(f"[n8n] Webhook notification sent to {request.notify_webhook}")
+        else:
+            logger.error(f"[n8n] Webhook notification failed: {response.status_code}")
 
     except Exception as e:
         logger.error(f"[n8n] Error sending webhook notification: {e}")
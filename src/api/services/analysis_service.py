@@ -2,12 +2,14 @@
 Python Analysis Microservice
 
 FastAPI 서비스로 Python의 강점(ML, NLP, LLM)을 TypeScript API Gateway에 제공
+동기 분석/LLM 호출은 asyncio.to_thread로 실행해 이벤트 루프를 막지 않습니다.
 """
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Any
+import asyncio
 import logging
 
 # Import from existing Python agent
@@ -88,7 +90,7 @@ async def sentiment_analysis(request: SentimentRequest):
     """
     try:
         logger.info(f"Sentiment analysis started: {len(request.items)} items")
-        result = analyze_sentiment(request.items)
+        result = await asyncio.to_thread(analyze_sentiment, request.items)
         logger.info(f"Sentiment analysis completed: {result}")
         return result
     except Exception as e:
@@ -105,7 +107,7 @@ async def keyword_extraction(request: KeywordRequest):
     """
     try:
         logger.info(f"Keyword extraction started: {len(request.items)} items")
-        result = extract_keywords(request.items)
+        result = await asyncio.to_thread(extract_keywords, request.items)
         logger.info(f"Keyword extraction completed: {result.get('total_unique_keywords')} keywords")
         return result
     except Exception as e:
@@ -122,7 +124,8 @@ async def summarization(request: SummarizeRequest):
     """
     try:
         logger.info(f"Summarization started: query={request.query}")
-        result = summarize_trend(
+        result = await asyncio.to_thread(
+            summarize_trend,
             query=request.query,
             normalized_items=request.normalized_items,
             analysis=request.analysis,
@@ -149,9 +152,11 @@ async def batch_analysis(request: SentimentRequest):
     try:
         logger.info(f"Batch analysis started: {len(request.items)} items")
 
-        # 병렬 처리 (Python asyncio)
-        sentiment = analyze_sentiment(request.items)
-        keywords = extract_keywords(request.items)
+        # 병렬 처리 (Python asyncio): 동기 분석 함수를 워커 스레드에서 동시에 실행
+        sentiment, keywords = await asyncio.gather(
+            asyncio.to_thread(analyze_sentiment, request.items),
+            asyncio.to_thread(extract_keywords, request.items),
+        )
 
         result = {"sentiment": sentiment, "keywords": keywords, "total_items": len(request.items)}
 
@@ -233,7 +238,8 @@ Return JSON format:
     }}
 }}"""
 
-    result = client.chat_json(
+    result = await asyncio.to_thread(
+        client.chat_json,
         messages=[
             {
                 "role": "system",
@@ -273,7 +279,8 @@ Return JSON format:
     "forecast_summary": "overall trend forecast"
 }}"""
 
-    result = client.chat_json(
+    result = await asyncio.to_thread(
+        client.chat_json,
         messages=[
             {
                 "role": "system",
@@ -314,7 +321,8 @@ Return JSON format:
     "overall_assessment": "summary of anomaly detection"
 }}"""
 
-    result = client.chat_json(
+    result = await asyncio.to_thread(
+        client.chat_json,
         messages=[
             {
                 "role": "system",
@@ -355,7 +363,8 @@ Return JSON format:
     }}
 }}"""
 
-    result = client.chat_json(
+    result = await asyncio.to_thread(
+        client.chat_json,
         messages=[
             {
                 "role": "system",
@@ -416,8 +425,11 @@ Now classify this test text:
 Text: {validated_data[-1]['text'][:200]}
 Label:"""
 
-        test_result = client.chat(
-            messages=[{"role": "user", "content": test_prompt}], temperature=0.1, max_tokens=50
+        test_result = await asyncio.to_thread(
+            client.chat,
+            messages=[{"role": "user", "content": test_prompt}],
+            temperature=0.1,
+            max_tokens=50,
         )
 
         return {
@@ -5,27 +5,66 @@ SSE 스트리밍을 위한 TaskStreamManager
 """
 
 import asyncio
+import functools
+from collections import deque
 import time
 import logging
-from typing import Dict, Any, AsyncGenerator, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Callable, Deque, Dict, Any, AsyncGenerator, Iterable, List, Optional
+from dataclasses import dataclass, field
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@functools.lru_cache(maxsize=32)
+def _sse_prefix(event: str) -> bytes:
+    """이벤트 타입별 SSE 헤더 + JSON 봉투 앞부분 (타입 수가 적으므로 한 번만 인코딩)"""
+    return b"event: " + event.encode() + b'\ndata: {"event":' + orjson.dumps(event) + b',"data":'
+
+
+@dataclass(slots=True)
 class StreamEvent:
     """스트리밍 이벤트"""
     event: str  # node_start, node_complete, error, complete
     data: Dict[str, Any] = field(default_factory=dict)
     timestamp: float = 0.0
+    _frame: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not self.timestamp:
             self.timestamp = time.time()
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {"event": self.event, "data": self.data, "timestamp": self.timestamp}
+
+    def encode(self, serializer: Optional[Callable[[Dict[str, Any]], bytes]] = None) -> bytes:
+        """
+        내부 전송용 바이트 직렬화
+
+        기본은 JSON(orjson). msgpack 지원 전송로에서는 serializer=ormsgpack.packb 등을 전달합니다.
+        """
+        if serializer is None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+        return serializer(self.to_dict())
+
+    def to_sse(self) -> bytes:
+        """
+        SSE 프레임으로 직렬화 (불변 봉투는 캐시, data/timestamp만 인코딩)
+
+        발행된 이벤트는 수정하지 않으므로 프레임을 한 번만 만들어
+        히스토리 리플레이/다중 구독자에서 재사용합니다.
+        """
+        frame = self._frame
+        if frame is None:
+            frame = self._frame = b"".join((
+                _sse_prefix(self.event),
+                orjson.dumps(self.data, option=orjson.OPT_NON_STR_KEYS),
+                b',"timestamp":',
+                orjson.dumps(self.timestamp),
+                b"}\n\n",
+            ))
+        return frame
 
 
 class TaskStreamManager:
@@ -36,11 +75,15 @@ class TaskStreamManager:
     - subscribe(): SSE 엔드포인트가 이벤트 소비 (async generator)
     - 히스토리 리플레이: 늦게 연결해도 지난 이벤트 수신
     - 타임아웃 기반 자동 정리
+    - 히스토리는 태스크당 최근 history_limit개만 보관 (장시간 스트림 메모리 상한)
     """
 
-    def __init__(self, timeout: float = 120.0, cleanup_delay: float = 60.0):
+    def __init__(
+        self, timeout: float = 120.0, cleanup_delay: float = 60.0, history_limit: int = 256
+    ):
         self._streams: Dict[str, asyncio.Queue] = {}
-        self._history: Dict[str, list] = {}
+        self._history: Dict[str, Deque[StreamEvent]] = {}
+        self._history_limit = history_limit
         self._completed: Dict[str, float] = {}  # task_id -> completed_at
         self._timeout = timeout
         self._cleanup_delay = cleanup_delay
@@ -48,18 +91,28 @@ class TaskStreamManager:
 
     async def emit(self, task_id: str, event: StreamEvent):
         """이벤트 발행"""
-        async with self._lock:
-            if task_id not in self._history:
-                self._history[task_id] = []
-            self._history[task_id].append(event)
+        await self.emit_many(task_id, (event,))
 
-            if task_id in self._streams:
-                try:
-                    self._streams[task_id].put_nowait(event)
-                except asyncio.QueueFull:
-                    logger.warning(f"Stream queue full for task {task_id}")
+    async def emit_many(self, task_id: str, events: Iterable[StreamEvent]):
+        """여러 이벤트를 순서대로 한 번의 락 획득으로 발행"""
+        finished = False
+        async with self._lock:
+            history = self._history.get(task_id)
+            if history is None:
+                history = self._history[task_id] = deque(maxlen=self._history_limit)
+            queue = self._streams.get(task_id)
+
+            for event in events:
+                history.append(event)
+                if queue is not None:
+                    try:
+                        queue.put_nowait(event)
+                    except asyncio.QueueFull:
+                        logger.warning(f"Stream queue full for task {task_id}")
+                if event.event in ("complete", "error"):
+                    finished = True
 
-        if event.event in ("complete", "error"):
+        if finished:
             self._completed[task_id] = time.time()
             # Schedule cleanup
             asyncio.get_event_loop().call_later(
@@ -72,6 +125,17 @@ class TaskStreamManager:
 
         이미 발행된 히스토리를 먼저 리플레이한 후, 실시간 이벤트를 스트리밍합니다.
         """
+        async for batch in self.subscribe_batches(task_id):
+            for event in batch:
+                yield event
+
+    async def subscribe_batches(self, task_id: str) -> AsyncGenerator[List[StreamEvent], None]:
+        """
+        이벤트를 묶음 단위로 구독
+
+        히스토리 리플레이는 한 묶음으로, 실시간 이벤트는 큐에 이미 쌓인 것까지 한 번에
+        꺼내 전달합니다. SSE 응답에서 이벤트마다 따로 write하지 않도록 할 때 사용합니다.
+        """
         # Snapshot history and create a fresh queue under the lock
         async with self._lock:
             history = list(self._history.get(task_id, []))
@@ -80,24 +144,30 @@ class TaskStreamManager:
             self._streams[task_id] = queue
 
         # Replay history snapshot
-        for event in history:
-            yield event
+        for i, event in enumerate(history):
             if event.event in ("complete", "error"):
+                yield history[: i + 1]
                 return
+        if history:
+            yield history
 
         # Stream real-time events (only new ones, not duplicates of history)
         start = time.time()
         while True:
             try:
-                event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                yield event
-                if event.event in ("complete", "error"):
-                    return
+                batch = [await asyncio.wait_for(queue.get(), timeout=30.0)]
             except asyncio.TimeoutError:
                 # Send keepalive
-                yield StreamEvent(event="keepalive", data={})
+                yield [StreamEvent(event="keepalive", data={})]
                 if time.time() - start > self._timeout:
                     return
+                continue
+
+            while batch[-1].event not in ("complete", "error") and not queue.empty():
+                batch.append(queue.get_nowait())
+            yield batch
+            if batch[-1].event in ("complete", "error"):
+                return
 
     async def _cleanup(self, task_id: str):
         """완료된 태스크의 스트림 정리"""
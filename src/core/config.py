@@ -17,6 +17,7 @@
 """
 
 import os
+import re
 import json
 import yaml
 from typing import Dict, Any, Optional
@@ -28,6 +29,15 @@ from pydantic_settings import BaseSettings
 
 logger = logging.getLogger(__name__)
 
+# Match ${VAR_NAME:-default} or ${VAR_NAME}
+_ENV_VAR_RE = re.compile(r"\$\{([^}:]+)(?::-([^}]*))?\}")
+
+
+def _replace_env(match: "re.Match[str]") -> str:
+    var_name = match.group(1)
+    default = match.group(2)
+    return os.getenv(var_name, default if default else "")
+
 
 class Environment(str, Enum):
     """배포 환경"""
@@ -331,22 +341,15 @@ class ConfigManager:
 
     def _expand_env_vars(self, data: Any) -> Any:
         """Recursively expand environment variables in config data"""
-        import re
-
         if isinstance(data, dict):
             return {k: self._expand_env_vars(v) for k, v in data.items()}
         elif isinstance(data, list):
             return [self._expand_env_vars(item) for item in data]
         elif isinstance(data, str):
-            # Match ${VAR_NAME:-default} or ${VAR_NAME}
-            pattern = r"\$\{([^}:]+)(?::-([^}]*))?\}"
-
-            def replace_env(match):
-                var_name = match.group(1)
-                default = match.group(2)
-                return os.getenv(var_name, default if default else "")
-
-            return re.sub(pattern, replace_env, data)
+            # Most values have no placeholder; skip the regex entirely for them
+            if "${" not in data:
+                return data
+            return _ENV_VAR_RE.sub(_replace_env, data)
         else:
             return data
 
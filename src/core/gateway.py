@@ -21,16 +21,21 @@ from src.integrations.llm.llm_client import get_llm_client
 
 _EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
 _PHONE_RE = re.compile(r"\b(?:\+?\d{1,3}[\s-]?)?(?:\(\d{2,4}\)|\d{2,4})[\s-]?\d{3,4}[\s-]?\d{4}\b")
+# Very light "unsafe" check (kept conservative); matched against the lowercased query
+_UNSAFE_RE = re.compile(
+    "|".join(["폭탄", "테러", "자살", "살인", "weapon", "terror", "suicide", "murder"])
+)
+# Queries that need multi-step reasoning (case-sensitive, like the original substring check)
+_COMPLEX_RE = re.compile(
+    "|".join(["전략", "원인", "비교", "시장", "분석", "roadmap", "strategy"])
+)
 
 
 def precheck_query(query: str) -> Dict[str, Any]:
     """Lightweight precheck (no extra dependencies)."""
     q = query or ""
     pii_found = bool(_EMAIL_RE.search(q) or _PHONE_RE.search(q))
-    # Very light "unsafe" check (kept conservative)
-    unsafe_keywords = {"폭탄", "테러", "자살", "살인", "weapon", "terror", "suicide", "murder"}
-    lowered = q.lower()
-    unsafe = any(k.lower() in lowered for k in unsafe_keywords)
+    unsafe = _UNSAFE_RE.search(q.lower()) is not None
     return {"pii_found": pii_found, "unsafe": unsafe}
 
 
@@ -71,7 +76,7 @@ def route_request(
         heuristic["complexity"] = "low"
         heuristic["summary_strategy"] = "cheap"
         heuristic["suggested_max_results"] = 10
-    if any(k in q for k in ["전략", "원인", "비교", "시장", "분석", "roadmap", "strategy"]):
+    if _COMPLEX_RE.search(q):
         heuristic["complexity"] = "high"
         heuristic["summary_strategy"] = "compound"
         heuristic["suggested_max_results"] = 30
@@ -2,8 +2,9 @@
 Self-Refinement Utilities
 """
 
+import functools
 import logging
-from typing import Optional, Type, TypeVar
+from typing import Any, Dict, Optional, Type, TypeVar
 from pydantic import BaseModel
 
 from src.integrations.llm.llm_client import LLMClient
@@ -14,6 +15,12 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+@functools.lru_cache(maxsize=None)
+def _json_schema(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """model_json_schema() 결과 캐시 (스키마는 모델별로 불변; 호출측에서 수정하지 않음)"""
+    return schema.model_json_schema()
+
+
 class RefineEngine:
     def __init__(self, llm_client: LLMClient):
         self.llm = llm_client
@@ -32,7 +39,7 @@ class RefineEngine:
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt},
                 ],
-                schema=schema.model_json_schema(),
+                schema=_json_schema(schema),
                 temperature=0.7,
                 **kwargs,
             )
@@ -6,26 +6,31 @@ import time
 import hashlib
 import json
 import pickle
+from collections import OrderedDict
 from pathlib import Path
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Optional, Union
 import functools
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
 class SimpleCache:
     """
-    TTL(Time To Live)을 지원하는 간단한 인메모리 캐시
+    TTL(Time To Live)을 지원하는 간단한 인메모리 캐시 (max_size 지정 시 LRU 제거)
     """
 
-    def __init__(self, default_ttl: int = 3600):
+    def __init__(self, default_ttl: int = 3600, max_size: Optional[int] = None):
         """
         Args:
             default_ttl: 기본 TTL 시간(초) (기본값: 1시간)
+            max_size: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거, None이면 무제한)
         """
-        self._cache = {}
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
         self.default_ttl = default_ttl
+        self.max_size = max_size
 
     def get(self, key: str) -> Optional[Any]:
         """만료되지 않은 경우 캐시에서 값 조회"""
@@ -40,6 +45,7 @@ class SimpleCache:
             logger.debug(f"Cache expired: {key}")
             return None
 
+        self._cache.move_to_end(key)
         logger.debug(f"Cache hit: {key}")
         return value
 
@@ -50,6 +56,10 @@ class SimpleCache:
 
         expiry = time.time() + ttl
         self._cache[key] = (value, expiry)
+        self._cache.move_to_end(key)
+        if self.max_size is not None:
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
         logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
 
     def clear(self):
@@ -138,16 +148,20 @@ class DiskCache:
 
 
 # Global cache instances
-_memory_cache = SimpleCache(default_ttl=3600)  # 1 hour
+_memory_cache = SimpleCache(default_ttl=3600, max_size=1024)  # 1 hour, LRU-bounded
 _disk_cache = DiskCache(cache_dir=".cache/agents", default_ttl=86400)  # 24 hours
 
 
-def cached(ttl: int = 3600, use_disk: bool = False, key_func: Optional[Callable] = None):
+def cached(
+    ttl: Union[int, Callable[..., int]] = 3600,
+    use_disk: bool = False,
+    key_func: Optional[Callable] = None,
+):
     """
     함수 결과를 캐싱하는 데코레이터
 
     Args:
-        ttl: TTL 시간(초)
+        ttl: TTL 시간(초), 또는 args/kwargs로부터 TTL을 계산하는 함수
         use_disk: 메모리 캐시 대신 디스크 캐시 사용
         key_func: args/kwargs로부터 캐시 키를 생성하는 선택적 함수
 
@@ -182,7 +196,7 @@ def cached(ttl: int = 3600, use_disk: bool = False, key_func: Optional[Callable]
             result = func(*args, **kwargs)
 
             # Store in cache
-            cache.set(cache_key, result, ttl=ttl)
+            cache.set(cache_key, result, ttl=ttl(*args, **kwargs) if callable(ttl) else ttl)
 
             return result
 
@@ -195,6 +209,16 @@ def cached(ttl: int = 3600, use_disk: bool = False, key_func: Optional[Callable]
     return decorator
 
 
+def content_hash(value: Any) -> str:
+    """
+    JSON 직렬화 가능한 값(예: 뉴스 항목 리스트)의 내용 기반 해시
+
+    cached(key_func=...)에서 큰 리스트 인자를 str() 대신 짧은 키로 만들 때 사용합니다.
+    """
+    data = orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 def cache_key_from_query(query: str, **params) -> str:
     """
     쿼리와 파라미터로부터 캐시 키 생성
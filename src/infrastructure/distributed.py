@@ -25,6 +25,8 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 
+from src.infrastructure.cache import SimpleCache, content_hash
+
 logger = logging.getLogger(__name__)
 
 
@@ -119,6 +121,12 @@ class InMemoryTaskQueue:
         except asyncio.QueueEmpty:
             return None
 
+    async def record(self, task: AgentTask) -> str:
+        """워커 큐를 거치지 않고 태스크 기록만 추가 (캐시 적중 등 이미 완료된 태스크)"""
+        async with self._lock:
+            self.tasks[task.task_id] = task
+        return task.task_id
+
     async def get_task(self, task_id: str) -> Optional[AgentTask]:
         """ID로 태스크 조회"""
         return self.tasks.get(task_id)
@@ -274,6 +282,8 @@ class DistributedAgentExecutor:
         num_workers: int = 4,
         agent_executor: Optional[Callable] = None,
         task_queue: Optional[InMemoryTaskQueue] = None,
+        result_cache_ttl: Optional[int] = None,
+        result_cache_size: int = 256,
     ):
         """
         분산 실행기 초기화
@@ -282,14 +292,41 @@ class DistributedAgentExecutor:
             num_workers: 워커 프로세스 수
             agent_executor: 에이전트를 실행할 비동기 함수
             task_queue: 태스크 큐 (None이면 인메모리 큐 생성)
+            result_cache_ttl: 지정 시 (agent_name, query, params)가 같은 태스크의 성공 결과를
+                이 시간(초) 동안 재사용하고 에이전트를 다시 실행하지 않음 (None이면 비활성)
+            result_cache_size: 결과 캐시 최대 항목 수 (LRU)
         """
         self.num_workers = num_workers
         self.agent_executor = agent_executor or self._default_executor
         self.task_queue = task_queue or InMemoryTaskQueue()
 
+        self._result_cache: Optional[SimpleCache] = None
+        if result_cache_ttl:
+            self._result_cache = SimpleCache(
+                default_ttl=result_cache_ttl, max_size=result_cache_size
+            )
+            self.agent_executor = self._with_result_cache(self.agent_executor)
+
         self.workers: List[AgentWorker] = []
         self.worker_tasks: List[asyncio.Task] = []
 
+    @staticmethod
+    def _result_key(agent_name: str, query: str, params: Dict[str, Any]) -> str:
+        """결과 캐시 키 (파라미터 순서와 무관한 내용 해시)"""
+        return content_hash({"agent": agent_name, "query": query, "params": params})
+
+    def _with_result_cache(self, agent_executor: Callable) -> Callable:
+        """성공한 실행 결과를 결과 캐시에 저장하는 래퍼"""
+
+        async def _execute(
+            agent_name: str, query: str, params: Dict[str, Any], task_id: Optional[str] = None
+        ) -> Dict[str, Any]:
+            result = await agent_executor(agent_name, query, params, task_id)
+            self._result_cache.set(self._result_key(agent_name, query, params), result)
+            return result
+
+        return _execute
+
     async def _default_executor(
         self, agent_name: str, query: str, params: Dict[str, Any], task_id: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -350,15 +387,26 @@ class DistributedAgentExecutor:
             태스크 ID
         """
         task_id = str(uuid.uuid4())
+        params = params or {}
 
         task = AgentTask(
             task_id=task_id,
             agent_name=agent_name,
             query=query,
-            params=params or {},
+            params=params,
             priority=priority,
         )
 
+        if self._result_cache is not None:
+            cached = self._result_cache.get(self._result_key(agent_name, query, params))
+            if cached is not None:
+                # 동일 요청의 최근 결과 재사용: 워커를 거치지 않고 완료 상태로 기록
+                task.status = TaskStatus.COMPLETED
+                task.started_at = task.completed_at = task.created_at
+                task.result = cached
+                logger.info(f"Task served from result cache: {task_id}")
+                return await self.task_queue.record(task)
+
         await self.task_queue.enqueue(task)
 
         return task_id
@@ -408,7 +456,8 @@ class DistributedAgentExecutor:
         Args:
             task_id: 대기할 태스크 ID
             timeout: 최대 대기 시간 (None = 무제한)
-            poll_interval: 폴링 간격 (초 단위)
+            poll_interval: 최대 폴링 간격 (초 단위). 짧게 시작해 두 배씩 늘려
+                빨리 끝나는 태스크는 고정 간격만큼 기다리지 않습니다.
 
         Returns:
             태스크 결과
@@ -418,6 +467,7 @@ class DistributedAgentExecutor:
             RuntimeError: 태스크 실패 시
         """
         start_time = time.time()
+        delay = min(0.01, poll_interval)
 
         while True:
             task = await self.task_queue.get_task(task_id)
@@ -438,7 +488,8 @@ class DistributedAgentExecutor:
             if timeout and (time.time() - start_time) > timeout:
                 raise TimeoutError(f"Task {task_id} timeout after {timeout}s")
 
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, poll_interval)
 
     async def wait_for_batch(
         self, task_ids: List[str], timeout: Optional[float] = None
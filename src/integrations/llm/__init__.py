@@ -8,7 +8,7 @@ from .analysis_tools import (
     analyze_texts_comprehensive,
     AnalysisResult,
 )
-from .llm_client import get_llm_client, LLMClient
+from .llm_client import get_llm_client, reset_llm_clients, LLMClient
 
 __all__ = [
     "analyze_sentiment_llm",
@@ -18,5 +18,6 @@ __all__ = [
     "analyze_texts_comprehensive",
     "AnalysisResult",
     "get_llm_client",
+    "reset_llm_clients",
     "LLMClient",
 ]
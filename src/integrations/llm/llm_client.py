@@ -15,12 +15,18 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 from typing import Any, Dict, List, Optional, cast
 
 logger = logging.getLogger(__name__)
 
-# Global client instance
+# Global client instance (최근 사용 프로바이더) + 프로바이더별 캐시
 _llm_client = None
+_llm_clients: Dict[str, "LLMClient"] = {}
+_llm_clients_lock = threading.Lock()
+
+# OpenAI-style role -> Gemini role (unknown roles map to "model")
+_GEMINI_ROLES: Dict[str, str] = {"user": "user", "system": "user", "assistant": "model"}
 
 
 class LLMClient:
@@ -334,15 +340,14 @@ class LLMClient:
         if client is None:
             raise ValueError("LLM client not initialized")
         # Convert to Gemini format
-        gemini_messages = []
-        for msg in messages:
-            role = "user" if msg["role"] in ["user", "system"] else "model"
-            gemini_messages.append(
-                {
-                    "role": role,
-                    "parts": [{"text": msg["content"]}],
-                }
-            )
+        roles = _GEMINI_ROLES
+        gemini_messages = [
+            {
+                "role": roles.get(msg["role"], "model"),
+                "parts": [{"text": msg["content"]}],
+            }
+            for msg in messages
+        ]
 
         response = client.generate_content(
             gemini_messages,
@@ -389,8 +394,12 @@ class LLMClient:
 
         # Parse JSON from response
         try:
+            stripped = response.strip()
+            # Fast path: json_mode responses are usually bare JSON, skip fence scanning
+            if stripped[:1] in ("{", "[") and stripped[-1:] in ("}", "]"):
+                json_str = stripped
             # Try to extract JSON from markdown code block
-            if "```json" in response:
+            elif "```json" in response:
                 json_str = response.split("```json")[1].split("```")[0]
             elif "```" in response:
                 json_str = response.split("```")[1].split("```")[0]
@@ -474,11 +483,28 @@ def get_llm_client(provider: Optional[str] = None) -> LLMClient:
     Get LLM client instance (singleton).
 
     Note:
-        - provider 인자를 넘기면 해당 프로바이더로 새 클라이언트를 생성합니다.
+        - provider 인자를 넘기면 해당 프로바이더 클라이언트를 반환합니다
+          (프로바이더별로 한 번만 생성되므로 에이전트 간 전환 시 SDK 재초기화가 없습니다).
         - 에이전트별 설정을 사용할 때는 src.core.config의 ConfigManager로
           provider를 결정한 뒤 이 함수에 전달하는 패턴을 권장합니다.
+        - API 키/엔드포인트 변경 후에는 reset_llm_clients()를 호출하세요.
     """
     global _llm_client
-    if _llm_client is None or (provider and _llm_client.provider != provider):
-        _llm_client = LLMClient(provider)
-    return _llm_client
+    client = _llm_client
+    if client is not None and (not provider or client.provider == provider):
+        return client
+    with _llm_clients_lock:
+        key = provider or os.getenv("LLM_PROVIDER", "openai")
+        client = _llm_clients.get(key)
+        if client is None:
+            client = _llm_clients[key] = LLMClient(key)
+        _llm_client = client
+    return client
+
+
+def reset_llm_clients() -> None:
+    """캐시된 LLM 클라이언트 폐기"""
+    global _llm_client
+    with _llm_clients_lock:
+        _llm_clients.clear()
+        _llm_client = None
@@ -7,6 +7,7 @@ Self-Refine 패턴으로 품질을 향상시킵니다.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 from enum import Enum
@@ -19,6 +20,18 @@ from .llm_client import get_llm_client
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _schema_json(schema: type[BaseModel]) -> str:
+    """스키마 JSON 문자열 (모델별로 한 번만 생성)"""
+    return schema.schema_json(indent=2)
+
+
+@functools.lru_cache(maxsize=None)
+def _properties_json(schema: type[BaseModel]) -> str:
+    """프롬프트용 properties JSON 문자열 (모델별로 한 번만 생성)"""
+    return json.dumps(schema.schema()["properties"], indent=2)
+
+
 # =============================================================================
 # Output Schemas
 # =============================================================================
@@ -291,7 +304,7 @@ def _refine_output(
     client = get_llm_client()
 
     # Get schema as JSON
-    schema_json = schema.schema_json(indent=2)
+    schema_json = _schema_json(schema)
 
     refine_prompt = f"""Improve this output based on the feedback:
 
@@ -344,11 +357,6 @@ def analyze_with_schema(texts: List[str], query: str, language: str = "ko") -> D
     client = get_llm_client()
     combined_text = "\n---\n".join(texts[:30])
 
-    # Get schemas
-    sentiment_schema = SentimentAnalysis.schema()
-    keyword_schema = KeywordExtraction.schema()
-    topic_schema = TopicClustering.schema()
-
     prompt = f"""Analyze the following texts about "{query}".
 
 Texts:
@@ -356,9 +364,9 @@ Texts:
 
 Provide comprehensive analysis in this JSON format:
 {{
-    "sentiment": {json.dumps(sentiment_schema['properties'], indent=2)},
-    "keywords": {json.dumps(keyword_schema['properties'], indent=2)},
-    "topics": {json.dumps(topic_schema['properties'], indent=2)}
+    "sentiment": {_properties_json(SentimentAnalysis)},
+    "keywords": {_properties_json(KeywordExtraction)},
+    "topics": {_properties_json(TopicClustering)}
 }}
 
 {'한국어로 작성하세요.' if language == 'ko' else 'Write in English.'}"""
@@ -400,7 +408,6 @@ def generate_mission_draft(insight: Dict[str, Any], language: str = "ko") -> Dic
         미션 초안
     """
     client = get_llm_client()
-    schema = MissionDraft.schema()
 
     prompt = f"""Based on this insight, generate a marketing mission draft:
 
@@ -408,7 +415,7 @@ Insight:
 {json.dumps(insight, ensure_ascii=False, indent=2)}
 
 Generate a mission in this JSON format:
-{json.dumps(schema['properties'], indent=2)}
+{_properties_json(MissionDraft)}
 
 {'한국어로 작성하세요.' if language == 'ko' else 'Write in English.'}
 Focus on actionable, measurable objectives."""
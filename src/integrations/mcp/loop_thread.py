@@ -0,0 +1,101 @@
+"""
+MCP 전용 공유 이벤트 루프 스레드
+
+동기 코드(에이전트 tools)에서 MCP를 호출할 때마다 asyncio.run()으로 새 루프를 만들면
+루프에 묶인 서버 프로세스(MCPClientPool)를 재사용할 수 없습니다.
+하나의 데몬 스레드에서 루프를 계속 돌리고, 모든 동기 호출을 그 루프로 제출합니다.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncLoopThread:
+    """
+    데몬 스레드에서 run_forever()로 도는 이벤트 루프
+
+    - submit(): 코루틴을 제출하고 concurrent.futures.Future 반환
+    - run(): 제출 후 결과를 동기적으로 대기
+    """
+
+    def __init__(self, name: str = "mcp-loop"):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """루프 (첫 접근 시 스레드 시작)"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._start()
+            assert self._loop is not None
+            return self._loop
+
+    def _start(self) -> None:
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def _run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=_run, name=self._name, daemon=True)
+        self._thread.start()
+        ready.wait()
+        self._loop = loop
+        logger.debug(f"Started shared event loop thread: {self._name}")
+
+    def submit(self, coro: Awaitable[T]) -> "Future[T]":
+        """코루틴을 공유 루프에 제출"""
+        loop = self.loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            raise RuntimeError("Cannot block on the shared MCP loop from inside itself")
+        return asyncio.run_coroutine_threadsafe(coro, loop)  # type: ignore[arg-type]
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """코루틴을 공유 루프에서 실행하고 결과 반환 (동기 호출용)"""
+        return self.submit(coro).result(timeout=timeout)
+
+    def stop(self) -> None:
+        """루프 종료 (프로세스 종료 시)"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5.0)
+        loop.close()
+
+
+_loop_thread: Optional[AsyncLoopThread] = None
+_loop_thread_lock = threading.Lock()
+
+
+def get_mcp_loop_thread() -> AsyncLoopThread:
+    """프로세스 전역 MCP 루프 스레드"""
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None:
+            _loop_thread = AsyncLoopThread()
+        return _loop_thread
+
+
+def run_on_mcp_loop(coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """동기 함수에서 MCP 코루틴을 공유 루프에 실행"""
+    return get_mcp_loop_thread().run(coro, timeout=timeout)
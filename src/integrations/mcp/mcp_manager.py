@@ -5,10 +5,13 @@ OpenAI API와 MCP Server를 통합하여 도구 호출을 관리합니다.
 """
 
 import os
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +33,9 @@ class MCPManager:
         )
         self.tools = []
         self.mcp_servers = {}
+        # Shared aiohttp session (keep-alive / DNS cache), bound to the loop that created it
+        self._http_session: Any = None
+        self._http_session_loop: Optional[asyncio.AbstractEventLoop] = None
         self._load_config()
 
     def _load_config(self):
@@ -212,10 +218,41 @@ class MCPManager:
             logger.error(f"Error calling tool {tool_name}: {e}", exc_info=True)
             return {"error": str(e)}
 
-    async def _brave_search(self, query: str, count: int = 10) -> Dict[str, Any]:
-        """Brave Search 실행"""
+    async def _get_http_session(self) -> Any:
+        """
+        공유 aiohttp 세션 반환 (필요 시 생성)
+
+        호출마다 ClientSession을 만들면 TCP/TLS 연결을 재사용할 수 없으므로
+        이벤트 루프당 하나의 세션을 유지합니다.
+        """
         import aiohttp
 
+        loop = asyncio.get_running_loop()
+        session = self._http_session
+        if session is not None and not session.closed and self._http_session_loop is loop:
+            return session
+
+        if session is not None and not session.closed:
+            # Created on another loop; it cannot be awaited from here
+            session.detach()
+
+        self._http_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            trust_env=True,
+            connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=30),
+        )
+        self._http_session_loop = loop
+        return self._http_session
+
+    async def close(self) -> None:
+        """공유 HTTP 세션 종료 (앱 종료 시 호출)"""
+        session, self._http_session = self._http_session, None
+        self._http_session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def _brave_search(self, query: str, count: int = 10) -> Dict[str, Any]:
+        """Brave Search 실행"""
         brave_api_key = os.getenv("BRAVE_API_KEY")
         if not brave_api_key:
             return {"error": "BRAVE_API_KEY not configured"}
@@ -224,22 +261,23 @@ class MCPManager:
         headers = {"Accept": "application/json", "X-Subscription-Token": brave_api_key}
         params = {"q": query, "count": count}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    results = []
-                    for item in data.get("web", {}).get("results", [])[:count]:
-                        results.append(
-                            {
-                                "title": item.get("title"),
-                                "url": item.get("url"),
-                                "description": item.get("description"),
-                            }
-                        )
-                    return {"results": results, "count": len(results)}
-                else:
-                    return {"error": f"Brave API error: {response.status}"}
+        session = await self._get_http_session()
+        async with session.get(url, headers=headers, params=params) as response:
+            if response.status == 200:
+                # Parse the (potentially large) result payload with orjson
+                data = orjson.loads(await response.read())
+                results = []
+                for item in data.get("web", {}).get("results", [])[:count]:
+                    results.append(
+                        {
+                            "title": item.get("title"),
+                            "url": item.get("url"),
+                            "description": item.get("description"),
+                        }
+                    )
+                return {"results": results, "count": len(results)}
+            else:
+                return {"error": f"Brave API error: {response.status}"}
 
     def _read_file(self, path: str) -> Dict[str, Any]:
         """파일 읽기"""
@@ -7,51 +7,15 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-import threading
 from typing import Any, Dict, List
 
+from src.integrations.mcp.loop_thread import run_on_mcp_loop
 from src.integrations.mcp.servers.mcp_client import call_mcp_tool
 
 logger = logging.getLogger(__name__)
 
 
-def _run_coro(coro_factory):
-    """
-    동기 함수에서 async 함수를 호출하기 위한 헬퍼.
-
-    - 현재 스레드에서 이벤트 루프가 실행 중이면(예: FastAPI/uvicorn), 같은 스레드에서
-      asyncio.run()/run_until_complete()를 호출할 수 없어 RuntimeError가 발생합니다.
-    - 이 경우 별도 스레드에서 asyncio.run()으로 실행하여 충돌을 방지합니다.
-    """
-    try:
-        # If a loop is running in this thread, this will succeed.
-        loop = asyncio.get_running_loop()
-        if loop.is_running():
-            result_holder: Dict[str, Any] = {}
-            error_holder: Dict[str, BaseException] = {}
-
-            def _runner():
-                try:
-                    result_holder["result"] = asyncio.run(coro_factory())
-                except BaseException as e:  # propagate exact exception type
-                    error_holder["error"] = e
-
-            t = threading.Thread(target=_runner, daemon=True)
-            t.start()
-            t.join()
-
-            if "error" in error_holder:
-                raise error_holder["error"]
-            return result_holder.get("result")
-    except RuntimeError:
-        # No running loop in this thread
-        pass
-
-    return asyncio.run(coro_factory())
-
-
 def search_news_via_mcp(
     query: str,
     time_window: str = "7d",
@@ -80,7 +44,8 @@ def search_news_via_mcp(
         )
 
     try:
-        result = _run_coro(_call) or {}
+        # 공유 MCP 루프에서 실행: 호출 스레드에 루프가 돌고 있어도 충돌하지 않음
+        result = run_on_mcp_loop(_call()) or {}
     except Exception as e:
         logger.error(f"News MCP call failed: {e}")
         return []
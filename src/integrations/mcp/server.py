@@ -16,7 +16,7 @@ import sys
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -381,6 +381,15 @@ TOOLS = [
 ]
 
 
+# tool name -> handler (one dict lookup per call instead of an if/elif chain)
+_TOOL_HANDLERS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "analyze_news_trend": run_news_trend_analysis,
+    "analyze_viral_videos": run_viral_video_analysis,
+    "get_recent_reports": get_recent_reports,
+    "get_agent_status": lambda **_: get_agent_status(),
+}
+
+
 def handle_call_tool(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
     MCP 도구 호출 처리
@@ -394,20 +403,14 @@ def handle_call_tool(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any
     """
     logger.info(f"Tool called: {tool_name} with args: {arguments}")
 
-    if tool_name == "analyze_news_trend":
-        return run_news_trend_analysis(**arguments)
-    elif tool_name == "analyze_viral_videos":
-        return run_viral_video_analysis(**arguments)
-    elif tool_name == "get_recent_reports":
-        return get_recent_reports(**arguments)
-    elif tool_name == "get_agent_status":
-        return get_agent_status()
-    else:
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if handler is None:
         return {
             "success": False,
             "error": f"Unknown tool: {tool_name}",
             "available_tools": [t["name"] for t in TOOLS],
         }
+    return handler(**arguments)
 
 
 def main():
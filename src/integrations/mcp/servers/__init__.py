@@ -1,8 +1,11 @@
 """MCP client for connecting to external MCP servers."""
 
-from .mcp_client import MCPClientManager, MCPClient
+from .mcp_client import MCPClientManager, MCPClient, MCPClientPool, ToolDef, get_mcp_client_pool
 
 __all__ = [
     "MCPClientManager",
     "MCPClient",
+    "MCPClientPool",
+    "ToolDef",
+    "get_mcp_client_pool",
 ]
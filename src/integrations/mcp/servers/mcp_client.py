@@ -8,12 +8,14 @@ Uses the Model Context Protocol to communicate with servers via stdio.
 from __future__ import annotations
 
 import os
-import json
+import time
 import asyncio
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+from contextlib import AsyncExitStack, asynccontextmanager
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,64 @@ logger = logging.getLogger(__name__)
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "mcp_config.json"
 
 
+# Plain-dict snapshot of os.environ (copying os._Environ re-decodes every entry)
+_base_env: Optional[Dict[str, str]] = None
+
+
+def _default_env() -> Dict[str, str]:
+    """Cached environment snapshot used as the base for server processes."""
+    global _base_env
+    if _base_env is None:
+        _base_env = dict(os.environ)
+    return _base_env
+
+
+def refresh_env() -> None:
+    """Drop the cached environment snapshot (call after changing os.environ)."""
+    global _base_env
+    _base_env = None
+
+
+# path -> (st_mtime_ns, parsed config); re-read only when the file changes
+_config_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _read_config(path: Path) -> Dict[str, Any]:
+    """Read and parse an MCP config file, cached by (path, mtime)."""
+    key = str(path)
+    mtime = path.stat().st_mtime_ns
+    cached = _config_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    config = orjson.loads(path.read_bytes())
+    _config_cache[key] = (mtime, config)
+    return config
+
+
+class ToolDef(NamedTuple):
+    """Tool definition returned by tools/list (use ._asdict() for the JSON shape)."""
+
+    name: str
+    description: str
+    inputSchema: Dict[str, Any]
+
+
+def _parse_tool_text(text: str) -> Any:
+    """
+    Parse a tool text payload as JSON only when it looks like a complete object/array.
+
+    Plain-text results skip the decode attempt entirely.
+    """
+    stripped = text.strip()
+    if stripped[:1] in ("{", "[") and stripped[-1:] in ("}", "]"):
+        try:
+            return orjson.loads(stripped)
+        except orjson.JSONDecodeError:
+            pass
+    return {"text": text}
+
+
 class MCPClient:
     """
     Client for communicating with a single MCP server.
@@ -44,6 +104,9 @@ class MCPClient:
         self._process: Optional[asyncio.subprocess.Process] = None
         self._request_id = 0
         self._initialized = False
+        # tools/list result for the current server process (cleared on restart
+        # or notifications/tools/list_changed)
+        self._tools_cache: Optional[Tuple[ToolDef, ...]] = None
 
     @property
     def is_running(self) -> bool:
@@ -55,15 +118,17 @@ class MCPClient:
         if self.is_running:
             return
 
-        # Prepare environment with substitutions
-        process_env = os.environ.copy()
-        for key, value in self.env.items():
-            # Handle ${VAR} substitution
-            if value.startswith("${") and value.endswith("}"):
-                env_var = value[2:-1]
-                process_env[key] = os.getenv(env_var, "")
-            else:
-                process_env[key] = value
+        # Prepare environment with substitutions (None = inherit unchanged)
+        process_env: Optional[Dict[str, str]] = None
+        if self.env:
+            process_env = dict(_default_env())
+            for key, value in self.env.items():
+                # Handle ${VAR} substitution
+                if value.startswith("${") and value.endswith("}"):
+                    env_var = value[2:-1]
+                    process_env[key] = os.getenv(env_var, "")
+                else:
+                    process_env[key] = value
 
         try:
             self._process = await asyncio.create_subprocess_exec(
@@ -71,7 +136,9 @@ class MCPClient:
                 *self.args,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                # stderr is never read; a PIPE would eventually fill and block a
+                # long-lived (pooled) server
+                stderr=asyncio.subprocess.DEVNULL,
                 env=process_env,
             )
             logger.info(f"Started MCP server: {self.name}")
@@ -95,8 +162,22 @@ class MCPClient:
             finally:
                 self._process = None
                 self._initialized = False
+                self._tools_cache = None
                 logger.info(f"Stopped MCP server: {self.name}")
 
+    def kill(self) -> None:
+        """Kill the server process without awaiting (e.g. its event loop is gone)."""
+        if self._process:
+            try:
+                self._process.kill()
+            except (ProcessLookupError, RuntimeError):
+                pass
+            finally:
+                self._process = None
+                self._initialized = False
+                self._tools_cache = None
+                logger.info(f"Killed MCP server: {self.name}")
+
     async def _initialize(self) -> None:
         """Send initialize request to the server."""
         response = await self._send_request(
@@ -131,27 +212,40 @@ class MCPClient:
             request["params"] = params
 
         # Send request
-        request_bytes = (json.dumps(request) + "\n").encode()
+        request_bytes = orjson.dumps(request) + b"\n"
         self._process.stdin.write(request_bytes)
         await self._process.stdin.drain()
 
-        # Read response
+        # Read response (server notifications may arrive before it)
         try:
-            response_line = await asyncio.wait_for(self._process.stdout.readline(), timeout=30.0)
-            if response_line:
-                response = json.loads(response_line.decode())
-                if "error" in response:
-                    logger.error(f"MCP error from {self.name}: {response['error']}")
+            while True:
+                response_line = await asyncio.wait_for(
+                    self._process.stdout.readline(), timeout=30.0
+                )
+                if not response_line:
                     return None
-                return response.get("result")
+                response = orjson.loads(response_line)
+                if "id" in response:
+                    break
+                self._handle_notification(response)
+
+            if "error" in response:
+                logger.error(f"MCP error from {self.name}: {response['error']}")
+                return None
+            return response.get("result")
         except asyncio.TimeoutError:
             logger.error(f"Timeout waiting for response from {self.name}")
+            # A late response would desync the stream for the next request
+            self.kill()
             return None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON from {self.name}: {e}")
             return None
 
-        return None
+    def _handle_notification(self, message: Dict[str, Any]) -> None:
+        """Handle a server-initiated notification read while awaiting a response."""
+        if message.get("method") == "notifications/tools/list_changed":
+            self._tools_cache = None
 
     async def _send_notification(
         self, method: str, params: Optional[Dict[str, Any]] = None
@@ -167,19 +261,24 @@ class MCPClient:
         if params:
             notification["params"] = params
 
-        notification_bytes = (json.dumps(notification) + "\n").encode()
+        notification_bytes = orjson.dumps(notification) + b"\n"
         self._process.stdin.write(notification_bytes)
         await self._process.stdin.drain()
 
-    async def list_tools(self) -> List[Dict[str, Any]]:
-        """List available tools from the server."""
+    async def list_tools(self) -> List[ToolDef]:
+        """List available tools from the server (cached per server process)."""
         if not self._initialized:
             await self.start()
 
-        response = await self._send_request("tools/list", {})
-        if response and "tools" in response:
-            return response["tools"]
-        return []
+        if self._tools_cache is None:
+            response = await self._send_request("tools/list", {})
+            if not (response and "tools" in response):
+                return []
+            self._tools_cache = tuple(
+                ToolDef(t["name"], t.get("description", ""), t.get("inputSchema") or {})
+                for t in response["tools"]
+            )
+        return list(self._tools_cache)
 
     async def call_tool(
         self, name: str, arguments: Optional[Dict[str, Any]] = None
@@ -200,11 +299,7 @@ class MCPClient:
                 result = {}
                 for item in content:
                     if item.get("type") == "text":
-                        try:
-                            # Try to parse as JSON
-                            result = json.loads(item.get("text", "{}"))
-                        except json.JSONDecodeError:
-                            result = {"text": item.get("text", "")}
+                        result = _parse_tool_text(item.get("text", "{}"))
                 return result
 
         return {"error": f"Failed to call tool {name} on {self.name}"}
@@ -253,8 +348,7 @@ class MCPClientManager:
             return
 
         try:
-            with open(self.config_path) as f:
-                self._config = json.load(f)
+            self._config = _read_config(self.config_path)
 
             # Create clients for each server
             servers = self._config.get("mcpServers", {})
@@ -326,45 +420,219 @@ class MCPClientManager:
 
         return await client.call_tool(tool_name, arguments)
 
-    async def list_all_tools(self) -> Dict[str, List[Dict[str, Any]]]:
-        """List tools from all configured servers."""
-        all_tools = {}
+    async def list_all_tools(self) -> Dict[str, List[ToolDef]]:
+        """List tools from all configured servers (queried concurrently)."""
+        names = list(self._clients.keys())
+        results = await asyncio.gather(
+            *(self._clients[name].list_tools() for name in names), return_exceptions=True
+        )
 
-        for name, client in self._clients.items():
-            try:
-                tools = await client.list_tools()
-                all_tools[name] = tools
-            except Exception as e:
-                logger.error(f"Failed to list tools from {name}: {e}")
+        all_tools: Dict[str, List[ToolDef]] = {}
+        for name, tools in zip(names, results):
+            if isinstance(tools, BaseException):
+                logger.error(f"Failed to list tools from {name}: {tools}")
                 all_tools[name] = []
+            else:
+                all_tools[name] = tools
 
         return all_tools
 
+    async def start_session(
+        self, *server_names: str, init_timeout: float = 30.0, init_retries: int = 2
+    ) -> Tuple[Dict[str, MCPClient], AsyncExitStack]:
+        """
+        Start specific MCP servers and hand back their clients with an exit stack.
+
+        Servers are started concurrently; each start/initialize is bounded by
+        init_timeout seconds and retried up to init_retries attempts in total.
+        If any fails to start, the ones that did start are stopped and the error
+        is raised. The caller owns the lifetime and closes it with
+        ``await stack.aclose()``, so clients can outlive a single ``async with``.
+        """
+        if not server_names:
+            server_names = tuple(self._clients.keys())
+
+        clients = {}
+        for name in server_names:
+            client = self.get_client(name)
+            if client:
+                clients[name] = client
+
+        started_clients: Dict[str, MCPClient] = {}
+        stack = AsyncExitStack()
+        stack.push_async_callback(_stop_clients, started_clients)
+
+        try:
+            results = await asyncio.gather(
+                *(_start_client(c, init_timeout, init_retries) for c in clients.values()),
+                return_exceptions=True,
+            )
+            errors = []
+            for (name, client), result in zip(clients.items(), results):
+                if isinstance(result, BaseException):
+                    # A timed-out start may have spawned the process already
+                    client.kill()
+                    errors.append(result)
+                else:
+                    started_clients[name] = client
+            if errors:
+                raise errors[0]
+        except BaseException:
+            await stack.aclose()
+            raise
+
+        return started_clients, stack
+
     @asynccontextmanager
-    async def session(self, *server_names: str):
+    async def session(
+        self, *server_names: str, init_timeout: float = 30.0, init_retries: int = 2
+    ):
         """
-        Context manager for using specific MCP servers.
+        Context manager for using specific MCP servers (see start_session).
 
         Usage:
             async with manager.session("x-mcp", "youtube-mcp") as clients:
                 result = await clients["x-mcp"].call_tool("search_tweets", {...})
         """
-        if not server_names:
-            server_names = tuple(self._clients.keys())
+        clients, stack = await self.start_session(
+            *server_names, init_timeout=init_timeout, init_retries=init_retries
+        )
+        async with stack:
+            yield clients
+
 
-        started_clients = {}
+async def _start_client(client: MCPClient, init_timeout: float, init_retries: int) -> None:
+    """Start a client, retrying when start/initialize exceeds init_timeout."""
+    attempts = max(1, init_retries)
+    for attempt in range(1, attempts + 1):
         try:
-            for name in server_names:
-                client = self.get_client(name)
-                if client:
-                    await client.start()
-                    started_clients[name] = client
+            await asyncio.wait_for(client.start(), timeout=init_timeout)
+            return
+        except asyncio.TimeoutError:
+            # A timed-out start may have spawned the process already
+            client.kill()
+            if attempt == attempts:
+                raise
+            logger.warning(
+                f"MCP server {client.name} did not initialize within {init_timeout}s "
+                f"(attempt {attempt}/{attempts}), retrying"
+            )
+
+
+async def _stop_clients(clients: Dict[str, MCPClient]) -> None:
+    """Stop the given clients concurrently."""
+    await asyncio.gather(*(client.stop() for client in clients.values()), return_exceptions=True)
+
+
+PoolKey = Tuple[str, Tuple[str, ...], FrozenSet[Tuple[str, str]]]
+
+
+class MCPClientPool:
+    """
+    Pool of started MCP server processes, reused across tool calls.
 
-            yield started_clients
+    Spawning the server and the initialize handshake are paid once per pooled
+    process instead of once per call. Clients are checked out exclusively (one
+    in-flight JSON-RPC request per process), expire after idle_ttl seconds, and
+    are only reused on the event loop that started them.
+    """
+
+    def __init__(self, idle_ttl: float = 300.0, max_idle_per_key: int = 4):
+        self.idle_ttl = idle_ttl
+        self.max_idle_per_key = max_idle_per_key
+        # key -> idle stack of (client, owning loop, last used)
+        self._idle: Dict[PoolKey, List[Tuple[MCPClient, asyncio.AbstractEventLoop, float]]] = {}
+
+    @staticmethod
+    def key_for(client: MCPClient) -> PoolKey:
+        return (client.command, tuple(client.args), frozenset(client.env.items()))
+
+    @asynccontextmanager
+    async def acquire(self, client: MCPClient) -> AsyncIterator[MCPClient]:
+        """
+        Check out a started client with the same command/args/env as client.
 
+        Usage:
+            async with pool.acquire(manager.get_client("x-mcp")) as c:
+                result = await c.call_tool("search_tweets", {...})
+        """
+        loop = asyncio.get_running_loop()
+        key = self.key_for(client)
+
+        pooled = self._take_idle(key, loop)
+        if pooled is None:
+            pooled = MCPClient(
+                name=client.name,
+                command=client.command,
+                args=list(client.args),
+                env=dict(client.env),
+                description=client.description,
+            )
+            await pooled.start()
+
+        healthy = False
+        try:
+            yield pooled
+            healthy = True
         finally:
-            for client in started_clients.values():
-                await client.stop()
+            if healthy and pooled.is_running:
+                self._release(key, pooled, loop)
+            else:
+                await pooled.stop()
+
+    def _take_idle(self, key: PoolKey, loop: asyncio.AbstractEventLoop) -> Optional[MCPClient]:
+        idle = self._idle.get(key)
+        now = time.monotonic()
+        while idle:
+            client, owner, last_used = idle.pop()
+            if owner is loop and client.is_running and now - last_used <= self.idle_ttl:
+                return client
+            self._discard(client, owner)
+        return None
+
+    def _release(self, key: PoolKey, client: MCPClient, loop: asyncio.AbstractEventLoop) -> None:
+        idle = self._idle.setdefault(key, [])
+        idle.append((client, loop, time.monotonic()))
+        while len(idle) > self.max_idle_per_key:
+            old_client, old_owner, _ = idle.pop(0)
+            self._discard(old_client, old_owner)
+
+    @staticmethod
+    def _discard(client: MCPClient, owner: asyncio.AbstractEventLoop) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if owner is running and not owner.is_closed():
+            owner.create_task(client.stop())
+        else:
+            client.kill()
+
+    async def close_all(self) -> None:
+        """Stop every idle pooled server (call on shutdown)."""
+        idle, self._idle = self._idle, {}
+        loop = asyncio.get_running_loop()
+        for entries in idle.values():
+            for client, owner, _ in entries:
+                if owner is loop:
+                    await client.stop()
+                else:
+                    client.kill()
+
+    def size(self) -> int:
+        """Number of idle pooled clients."""
+        return sum(len(entries) for entries in self._idle.values())
+
+
+_client_pool: Optional[MCPClientPool] = None
+
+
+def get_mcp_client_pool() -> MCPClientPool:
+    """Get the process-wide MCP client pool."""
+    global _client_pool
+    if _client_pool is None:
+        _client_pool = MCPClientPool()
+    return _client_pool
 
 
 # Convenience functions
@@ -397,9 +665,5 @@ async def call_mcp_tool(
     if not client:
         return {"error": f"MCP server not found: {server_name}"}
 
-    try:
-        await client.start()
-        result = await client.call_tool(tool_name, arguments)
-        return result
-    finally:
-        await client.stop()
+    async with get_mcp_client_pool().acquire(client) as pooled:
+        return await pooled.call_tool(tool_name, arguments)
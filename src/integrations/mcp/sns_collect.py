@@ -20,6 +20,7 @@ import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
+from src.integrations.mcp.loop_thread import run_on_mcp_loop
 from src.integrations.mcp.servers.mcp_client import call_mcp_tool
 from src.integrations.mcp.supadata_contract import (
     parse_supadata_tiktok_videos,
@@ -31,19 +32,6 @@ from src.integrations.mcp.utils import retry_with_backoff
 logger = logging.getLogger(__name__)
 
 
-def _run_coro(coro):
-    """동기 함수에서 async 함수를 호출하기 위한 헬퍼."""
-    try:
-        return asyncio.run(coro)
-    except RuntimeError:
-        # 이미 이벤트 루프가 있을 경우 (예: Jupyter), 새 루프에서 실행
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
-
-
 @retry_with_backoff(retries=2, backoff_factor=1.5)
 async def _call_mcp_safe(server: str, tool: str, args: Dict[str, Any]) -> Dict[str, Any]:
     """재시도 로직이 포함된 내부 호출 함수."""
@@ -99,7 +87,7 @@ def fetch_x_posts_via_mcp(
     tool_name: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """X 포스트 수집 (Sync Wrapper)"""
-    return _run_coro(fetch_x_posts_via_mcp_async(query, max_results, server_name, tool_name))
+    return run_on_mcp_loop(fetch_x_posts_via_mcp_async(query, max_results, server_name, tool_name))
 
 
 async def fetch_tiktok_videos_via_mcp_async(
@@ -155,7 +143,9 @@ def fetch_tiktok_videos_via_mcp(
     tool_name: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """TikTok 영상 수집 (Sync Wrapper)"""
-    return _run_coro(fetch_tiktok_videos_via_mcp_async(query, max_count, server_name, tool_name))
+    return run_on_mcp_loop(
+        fetch_tiktok_videos_via_mcp_async(query, max_count, server_name, tool_name)
+    )
 
 
 async def fetch_youtube_videos_via_mcp_async(
@@ -218,7 +208,7 @@ def fetch_youtube_videos_via_mcp(
     tool_name: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """YouTube 트렌딩 수집 (Sync Wrapper)"""
-    return _run_coro(
+    return run_on_mcp_loop(
         fetch_youtube_videos_via_mcp_async(market, time_window, max_results, server_name, tool_name)
     )
 
@@ -263,4 +253,4 @@ def fetch_all_sns_trends(
     max_results: int = 20,
 ) -> Dict[str, List[Dict[str, Any]]]:
     """모든 SNS 플랫폼 병렬 수집 (Sync Wrapper)"""
-    return _run_coro(fetch_all_sns_trends_async(query, market, max_results))
+    return run_on_mcp_loop(fetch_all_sns_trends_async(query, market, max_results))
@@ -25,6 +25,10 @@ def _pick_list(resp: Dict[str, Any], keys: Sequence[str]) -> List[Dict[str, Any]
     return []
 
 
+# Row models are filled only with values already coerced by _first_str/_first_int, so they
+# use model_construct and skip per-item validation. The response envelope is still validated.
+
+
 def parse_supadata_x_posts(
     resp: Dict[str, Any],
 ) -> Tuple[SupadataToolResponse, List[SupadataXPost]]:
@@ -39,7 +43,7 @@ def parse_supadata_x_posts(
     posts: List[SupadataXPost] = []
     for r in rows:
         posts.append(
-            SupadataXPost(
+            SupadataXPost.model_construct(
                 id=_first_str(r, ["id", "tweet_id"]),
                 url=_first_str(r, ["url"]),
                 text=_first_str(r, ["text", "content"]),
@@ -63,7 +67,7 @@ def parse_supadata_tiktok_videos(
     vids: List[SupadataTikTokVideo] = []
     for r in rows:
         vids.append(
-            SupadataTikTokVideo(
+            SupadataTikTokVideo.model_construct(
                 id=_first_str(r, ["id", "video_id"]),
                 url=_first_str(r, ["url", "webVideoUrl"]),
                 title=_first_str(r, ["title", "desc"]),
@@ -95,7 +99,7 @@ def parse_supadata_youtube_videos(
         snippet = r.get("snippet") if isinstance(r.get("snippet"), dict) else {}
 
         vids.append(
-            SupadataYouTubeVideo(
+            SupadataYouTubeVideo.model_construct(
                 id=_first_str(r, ["id", "video_id"]),
                 url=_first_str(r, ["url"]),
                 title=_first_str(r, ["title"]) or _first_str(snippet, ["title"]),
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import re
+import threading
+import orjson
 import urllib3
 from typing import Any, Dict, List, Optional
 
 import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+from urllib3.util.retry import Retry
 
 try:
     from bs4 import BeautifulSoup  # type: ignore
@@ -20,6 +25,60 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _http_session() -> requests.Session:
+    """프로세스 공유 HTTP 세션 (커넥션 풀로 TCP/TLS 핸드셰이크 재사용)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=20,
+                    pool_maxsize=50,
+                    max_retries=Retry(
+                        total=2,
+                        backoff_factor=0.3,
+                        status_forcelist=(502, 503, 504),
+                        allowed_methods=frozenset({"GET"}),
+                        raise_on_status=False,
+                    ),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+# 반복 사용하는 정규식은 모듈 로드 시 한 번만 컴파일
+_SITE_TITLE_SUFFIX_RE = re.compile(r"\s*[-|]\s*.*$")
+_CHAPTER_TIME_RES = (
+    re.compile(r"\[?(\d{1,2}):(\d{2})(?::(\d{2}))?\]?\s+(.+)"),  # [0:00] 또는 0:00
+    re.compile(r"\((\d{1,2}):(\d{2})(?::(\d{2}))?\)\s+(.+)"),  # (1:23)
+    re.compile(
+        r"Chapter\s+\d+:\s*(\d{1,2}):(\d{2})(?::(\d{2}))?\s+(.+)", re.IGNORECASE
+    ),  # Chapter 1: 0:00
+    re.compile(r"\d+\.\s*(\d{1,2}):(\d{2})(?::(\d{2}))?\s+(.+)"),  # 1. 0:00
+    re.compile(r"(\d{1,2}):(\d{2})(?::(\d{2}))?\s+(.+)"),  # 기본 형식
+)
+_CHAPTER_KO_RE = re.compile(r"(\d+)분\s+(\d+)초\s+(.+)")
+
+
+def _read_capped(resp: requests.Response, limit: int) -> bytes:
+    """스트리밍 응답 본문을 limit 바이트까지만 읽음 (큰 페이지 전체를 메모리에 올리지 않음)"""
+    buf = bytearray()
+    try:
+        for chunk in resp.iter_content(chunk_size=65536):
+            buf += chunk
+            if len(buf) >= limit:
+                break
+    finally:
+        resp.close()
+    return bytes(buf[:limit])
+
 
 class HttpMCP:
     """간단한 HTTP MCP: 지정된 URL을 가져와 텍스트/JSON 스니펫을 반환.
@@ -61,7 +120,7 @@ class HttpMCP:
             if title_tag and title_tag.string:
                 title = title_tag.string.strip()
                 # 제목에서 불필요한 부분 제거 (예: " - 홈페이지", " | 사이트명")
-                title = re.sub(r"\s*[-|]\s*.*$", "", title)
+                title = _SITE_TITLE_SUFFIX_RE.sub("", title)
                 if title:
                     return title
 
@@ -90,13 +149,8 @@ class HttpMCP:
         """URL 정규화 (공백 제거, 인코딩 등)"""
         if not url:
             return url
-        # 공백 제거
-        url = url.strip().replace(" ", "")
-        # 여러 공백을 하나로
-        import re
-
-        url = re.sub(r"\s+", "", url)
-        return url
+        # 모든 공백 문자 제거 (str.split()은 유니코드 공백 전체를 C 레벨에서 처리)
+        return "".join(url.split())
 
     def fetch(self, url: str) -> Dict[str, Any]:
         """URL에서 콘텐츠 가져오기 (SSL 오류 시 자동 재시도)"""
@@ -112,11 +166,12 @@ class HttpMCP:
         try:
             # 첫 시도: verify_ssl 설정 사용
             try:
-                resp = requests.get(
+                resp = _http_session().get(
                     url,
                     timeout=self.timeout,
                     headers={"User-Agent": "LangGraph-MCP/1.0"},
                     verify=self.verify_ssl,
+                    stream=True,
                 )
                 resp.raise_for_status()
             except ssl_errors as ssl_err:
@@ -124,11 +179,12 @@ class HttpMCP:
                 logger.debug(f"SSL error for {url}, retrying with verify=False: {ssl_err}")
                 if self.verify_ssl:  # verify_ssl이 True였던 경우에만 재시도
                     try:
-                        resp = requests.get(
+                        resp = _http_session().get(
                             url,
                             timeout=self.timeout,
                             headers={"User-Agent": "LangGraph-MCP/1.0"},
                             verify=False,
+                            stream=True,
                         )
                         resp.raise_for_status()
                     except Exception as retry_err:
@@ -145,18 +201,20 @@ class HttpMCP:
 
             # 성공적으로 응답 받음
             ctype = resp.headers.get("content-type", "")
-            content = resp.content[: self.max_bytes]
             text: str | None = None
             data: Any | None = None
             site_name: str = ""
 
             if "application/json" in ctype:
+                # JSON은 전체 본문이 있어야 파싱 가능
+                body = resp.content
                 try:
-                    data = resp.json()
+                    data = orjson.loads(body)
                 except Exception:
-                    text = content.decode("utf-8", errors="ignore")
+                    text = body[: self.max_bytes].decode("utf-8", errors="ignore")
             else:
-                text = content.decode("utf-8", errors="ignore")
+                # 텍스트/HTML은 max_bytes까지만 스트리밍으로 읽고 중단
+                text = _read_capped(resp, self.max_bytes).decode("utf-8", errors="ignore")
                 # HTML인 경우 사이트명 추출 시도
                 if text and ("text/html" in ctype or "html" in ctype.lower()):
                     site_name = self._extract_site_name(text, url)
@@ -231,7 +289,7 @@ class WebSearchMCP:
         # 1순위: 정부기관 검색 (더 많은 결과 요청)
         params = {"q": gov_query, "count": max(1, min(top_k * 2, 20))}
         try:
-            r = requests.get(
+            r = _http_session().get(
                 "https://api.search.brave.com/res/v1/web/search",
                 headers=headers,
                 params=params,
@@ -239,7 +297,7 @@ class WebSearchMCP:
                 verify=True,
             )
             r.raise_for_status()
-            data = r.json()
+            data = orjson.loads(r.content)
             results = data.get("web", {}).get("results", [])
             gov_urls = [item.get("url", "") for item in results if item.get("url")]
 
@@ -253,7 +311,7 @@ class WebSearchMCP:
 
         # 2순위: 일반 검색 (정부기관 결과가 부족할 때)
         params = {"q": query, "count": max(1, min(top_k * 2, 20))}
-        r = requests.get(
+        r = _http_session().get(
             "https://api.search.brave.com/res/v1/web/search",
             headers=headers,
             params=params,
@@ -261,7 +319,7 @@ class WebSearchMCP:
             verify=True,
         )
         r.raise_for_status()
-        data = r.json()
+        data = orjson.loads(r.content)
         results = data.get("web", {}).get("results", [])
         all_urls = [item.get("url", "") for item in results if item.get("url")]
 
@@ -311,11 +369,11 @@ class WebSearchMCP:
         # 1순위: 정부기관 검색
         params = {"q": gov_query, "api_key": self.serpapi_key, "num": max(1, min(top_k * 2, 20))}
         try:
-            r = requests.get(
+            r = _http_session().get(
                 "https://serpapi.com/search.json", params=params, timeout=self.timeout, verify=True
             )
             r.raise_for_status()
-            data = r.json()
+            data = orjson.loads(r.content)
             results = data.get("organic_results", [])
             gov_urls = []
             for item in results:
@@ -333,11 +391,11 @@ class WebSearchMCP:
 
         # 2순위: 일반 검색
         params = {"q": query, "api_key": self.serpapi_key, "num": max(1, min(top_k * 2, 20))}
-        r = requests.get(
+        r = _http_session().get(
             "https://serpapi.com/search.json", params=params, timeout=self.timeout, verify=True
         )
         r.raise_for_status()
-        data = r.json()
+        data = orjson.loads(r.content)
         results = data.get("organic_results", [])
         all_urls = []
         for item in results:
@@ -350,6 +408,30 @@ class WebSearchMCP:
         return prioritized_urls[:top_k]
 
 
+# 채널 ID가 없을 때 일반 영상 검색을 허용하는 YouTube 관련 키워드
+_YOUTUBE_KEYWORDS = (
+    "유튜브",
+    "youtube",
+    "영상",
+    "동영상",
+    "비디오",
+    "video",
+    "펭수",
+    "펭",
+    "채널",
+    "channel",
+    "놀이",
+    "배우",
+    "시청",
+    "콘텐츠",
+    "content",
+    "미디어",
+    "media",
+    "강의",
+    "교육영상",
+)
+
+
 class YouTubeMCP:
     """YouTube Data API v3 MCP 서버
 
@@ -750,16 +832,9 @@ class YouTubeMCP:
 
             # 패턴 1: [HH:]MM:SS 형식 (다양한 구분자 지원)
             # 예: 0:00, 1:23, 00:01:23, [0:00], (1:23), Chapter 1: 0:00
-            patterns = [
-                r"\[?(\d{1,2}):(\d{2})(?::(\d{2}))?\]?\s+(.+)",  # [0:00] 또는 0:00
-                r"\((\d{1,2}):(\d{2})(?::(\d{2}))?\)\s+(.+)",  # (1:23)
-                r"Chapter\s+\d+:\s*(\d{1,2}):(\d{2})(?::(\d{2}))?\s+(.+)",  # Chapter 1: 0:00
-                r"\d+\.\s*(\d{1,2}):(\d{2})(?::(\d{2}))?\s+(.+)",  # 1. 0:00
-                r"(\d{1,2}):(\d{2})(?::(\d{2}))?\s+(.+)",  # 기본 형식
-            ]
-
-            for pattern in patterns:
-                match = re.match(pattern, line, re.IGNORECASE)
+            # 모든 패턴에 ':'가 필요하므로 없으면 정규식 시도 생략
+            for pattern in _CHAPTER_TIME_RES if ":" in line else ():
+                match = pattern.match(line)
                 if match:
                     groups = match.groups()
                     if len(groups) == 4:  # HH:MM:SS 형식
@@ -795,7 +870,7 @@ class YouTubeMCP:
                     break
 
             # 패턴 2: 한글 형식 (N분 M초)
-            match = re.match(r"(\d+)분\s+(\d+)초\s+(.+)", line)
+            match = _CHAPTER_KO_RE.match(line) if "분" in line else None
             if match:
                 minutes = int(match.group(1))
                 seconds = int(match.group(2))
@@ -900,8 +975,6 @@ class YouTubeMCP:
         Returns:
             Dict[str, Any]: YouTube 영상 데이터 또는 None
         """
-        import asyncio
-
         youtube_api_key = os.getenv("YOUTUBE_API_KEY", "")
         youtube_channel_id_env = os.getenv("YOUTUBE_CHANNEL_ID", "")
         youtube_channel_handle = os.getenv("YOUTUBE_CHANNEL_HANDLE", "")
@@ -994,30 +1067,8 @@ class YouTubeMCP:
                 logger.warning(f"YouTubeMCP: Failed to search channel videos: {e}")
 
         # 채널 ID가 없으면 YouTube 관련 키워드가 있을 때만 일반 검색
-        youtube_keywords = [
-            "유튜브",
-            "youtube",
-            "영상",
-            "동영상",
-            "비디오",
-            "video",
-            "펭수",
-            "펭",
-            "채널",
-            "channel",
-            "놀이",
-            "배우",
-            "시청",
-            "콘텐츠",
-            "content",
-            "미디어",
-            "media",
-            "강의",
-            "교육영상",
-        ]
-
         query_lower = query.lower()
-        has_youtube_keyword = any(keyword in query_lower for keyword in youtube_keywords)
+        has_youtube_keyword = any(keyword in query_lower for keyword in _YOUTUBE_KEYWORDS)
 
         if has_youtube_keyword:
             try:
@@ -1068,6 +1119,17 @@ async def load_mcp_tools(servers: Dict[str, Dict[str, Any]]) -> List[Any]:
         return []
 
 
+async def load_mcp_tools_multi(servers: Dict[str, Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """서버별 도구 목록을 동시에 로드해 서버 이름별로 반환.
+
+    서버마다 load_mcp_tools를 gather로 실행하므로 N개 서버의 tools/list 왕복이
+    순차 N회가 아니라 한 번의 대기 구간에 겹칩니다. 실패한 서버는 빈 목록입니다.
+    """
+    names = list(servers)
+    results = await asyncio.gather(*(load_mcp_tools({name: servers[name]}) for name in names))
+    return dict(zip(names, results))
+
+
 async def build_mcp_toolnode(servers: Dict[str, Dict[str, Any]]) -> Optional[Any]:
     """서버 정의에서 도구를 로드해 ToolNode를 생성. 실패 시 None 반환."""
     if not MCP_LIB_AVAILABLE:
@@ -0,0 +1,82 @@
+"""
+Tests for News Trend Agent tools.
+"""
+
+from unittest.mock import patch
+
+from src.agents.news_trend.tools import (
+    _analyze_sentiment_keyword,
+    _corpus_digest,
+    _extract_keywords_frequency,
+)
+
+
+class TestKeywordSentiment:
+    """Test the keyword-based sentiment fallback."""
+
+    ITEMS = [
+        {"title": "AI 시장 성장", "description": "good news"},
+        {"title": "Market decline", "description": "우려가 커진다"},
+        {"title": "성공과 실패", "description": "mixed"},
+        {"title": "Plain headline", "description": ""},
+    ]
+
+    def test_counts(self):
+        """Items with only positive/negative hits are classified; mixed and none are neutral."""
+        result = _analyze_sentiment_keyword(self.ITEMS)
+        assert (result["positive"], result["negative"], result["neutral"]) == (1, 1, 2)
+        assert result["neutral_pct"] == 50.0
+
+    def test_automaton_matches_substring_fallback(self):
+        """The Aho-Corasick scan and the plain substring scan agree."""
+        with patch("src.agents.news_trend.tools._SENTIMENT_AUTOMATON", None):
+            fallback = _analyze_sentiment_keyword(self.ITEMS)
+        assert _analyze_sentiment_keyword(self.ITEMS) == fallback
+
+    def test_process_pool_chunks_match_serial(self):
+        """Large corpora scanned in chunks across processes give the same totals."""
+        items = [
+            {"title": item["title"], "description": f"{item['description']} {i}"}
+            for i in range(50)
+            for item in self.ITEMS
+        ]
+        serial = (_analyze_sentiment_keyword(items), _extract_keywords_frequency(items))
+        with patch("src.agents.news_trend.tools._PARALLEL_MIN_TEXTS", 10), patch(
+            "os.cpu_count", return_value=3
+        ):
+            chunked = (_analyze_sentiment_keyword(items), _extract_keywords_frequency(items))
+        assert chunked == serial
+
+    def test_republished_articles_counted_once(self):
+        """Items with the same normalized text are analyzed once."""
+        items = self.ITEMS + [{"title": " ai 시장 성장", "description": "GOOD NEWS "}]
+        assert _analyze_sentiment_keyword(items) == _analyze_sentiment_keyword(self.ITEMS)
+
+
+class TestFrequencyKeywords:
+    """Test the frequency-based keyword fallback."""
+
+    def test_counts_words_and_skips_stop_words(self):
+        """Words are lower-cased, stop words dropped, and ranked by count."""
+        items = [
+            {"title": "The AI 시장", "description": "AI growth"},
+            {"title": "ai 시장 은", "description": ""},
+        ]
+        result = _extract_keywords_frequency(items)
+        assert result["top_keywords"][:2] == [
+            {"keyword": "ai", "count": 3},
+            {"keyword": "시장", "count": 2},
+        ]
+        assert result["total_unique_keywords"] == 3
+
+
+class TestCorpusDigest:
+    """Test the analysis cache key for news corpora."""
+
+    def test_keyed_on_urls_and_titles(self):
+        """Items with URLs hash by (url, title); others fall back to full content."""
+        a = [{"url": "https://a", "title": "A", "content": "x" * 1000}]
+        b = [{"url": "https://a", "title": "A", "content": "different body"}]
+        assert _corpus_digest(a) == _corpus_digest(b)
+        assert _corpus_digest(a) != _corpus_digest([{"url": "https://b", "title": "A"}])
+        assert _corpus_digest([{"title": "A"}]).startswith("c:")
@@ -2,6 +2,7 @@
 Tests for Viral Video Agent graph nodes.
 """
 
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -13,6 +14,19 @@ from src.agents.viral_video.graph import (
     report_node,
     build_graph,
 )
+from src.agents.viral_video.tools import (
+    _calculate_z_score,
+    _calculate_z_scores,
+    _spike_stats,
+    _spike_stats_numpy,
+    _to_soa,
+    _get_sample_tiktok_data,
+    _get_sample_youtube_data,
+    detect_spike,
+    seed_sample_rng,
+    topic_cluster,
+    welford_mean_std,
+)
 
 
 def _make_state(**overrides) -> ViralAgentState:
@@ -128,6 +142,132 @@ class TestAnalyzeNode:
             assert result["analysis"]["total_items"] == 2
 
 
+class TestDetectSpike:
+    """Tests for detect_spike."""
+
+    def test_detects_and_sorts_spikes(self):
+        items = [{"video_id": f"v{i}", "views": 100} for i in range(50)]
+        items.append({"video_id": "big", "views": 100000})
+        items.append({"video_id": "bigger", "views": 120000})
+        result = detect_spike(items, threshold=2.0)
+        ids = [v["video_id"] for v in result["spike_videos"]]
+        assert ids == ["bigger", "big"]
+        assert result["total_spikes"] == 2
+        assert result["spike_videos"][0]["z_score"] > result["spike_videos"][1]["z_score"]
+
+    def test_zero_std_returns_no_spikes(self):
+        items = [{"video_id": f"v{i}", "views": 500} for i in range(5)]
+        result = detect_spike(items)
+        assert result["spike_videos"] == []
+        assert result["std_views"] == 0
+
+    def test_z_score_with_zero_std(self):
+        assert _calculate_z_score(5, [5, 5, 5]) == 0.0
+        assert _calculate_z_scores([5, 5, 5]).tolist() == [0.0, 0.0, 0.0]
+
+    def test_z_score_single_matches_batch(self):
+        values = [10, 20, 30, 40, 100]
+        batch = _calculate_z_scores(values)
+        for v, z in zip(values, batch):
+            assert _calculate_z_score(v, values) == pytest.approx(z)
+
+    def test_welford_matches_batch_stats(self):
+        values = [1.0, 5.0, 9.0, 13.0]
+        count, mean, std = welford_mean_std(values)
+        assert count == 4
+        assert mean == pytest.approx(7.0)
+        assert std == pytest.approx(20**0.5)
+
+    def test_zero_std_never_flags_spikes(self):
+        views = np.full(5, 42.0)
+        for stats in (_spike_stats, _spike_stats_numpy):
+            _, std, z, mask = stats(views, 0.0)
+            assert std == 0
+            assert not z.any()
+            assert not mask.any()
+
+    def test_fused_spike_stats_match_numpy(self):
+        views = np.array([10.0, 20.0, 30.0, 40.0, 5000.0])
+        mean, std, z, mask = _spike_stats(views, 1.5)
+        exp_mean, exp_std, exp_z, exp_mask = _spike_stats_numpy(views, 1.5)
+        assert mean == pytest.approx(exp_mean)
+        assert std == pytest.approx(exp_std)
+        assert np.allclose(z, exp_z)
+        assert (mask == exp_mask).all()
+
+
+class TestTopicCluster:
+    """Tests for topic_cluster."""
+
+    def test_clusters_by_first_matching_topic(self):
+        items = [
+            {"title": "Easy COOKING at home", "views": 100},
+            {"title": "오늘의 요리 브이로그", "views": 300},
+            {"title": "New GAMEPLAY trailer", "views": 200},
+            {"title": "Untitled", "views": 50},
+        ]
+        result = topic_cluster(items)
+        by_topic = {c["topic"]: c for c in result["top_clusters"]}
+        assert by_topic["음식/요리"]["count"] == 2
+        assert by_topic["음식/요리"]["avg_views"] == 200
+        assert by_topic["게임"]["count"] == 1
+        assert by_topic["기타"]["count"] == 1
+        assert result["total_clusters"] == 3
+
+    def test_regex_fallback_matches_automaton(self):
+        items = [
+            {"title": "Funny game review", "views": 10},
+            {"title": "여행 브이로그", "views": 20},
+            {"title": "nothing here", "views": 30},
+        ]
+        expected = topic_cluster(items)
+        with patch("src.agents.viral_video.tools._TOPIC_AUTOMATON", None):
+            assert topic_cluster(items) == expected
+
+    def test_shingle_prefilter_rejects_unrelated_titles(self):
+        automaton = MagicMock()
+        with patch("src.agents.viral_video.tools._TOPIC_AUTOMATON", automaton):
+            result = topic_cluster([{"title": "xyz qq", "views": 1}])
+        assert result["top_clusters"][0]["topic"] == "기타"
+        automaton.iter.assert_not_called()
+        assert topic_cluster([{"title": "My Daily VLOG", "views": 1}])["top_clusters"][0][
+            "topic"
+        ] == "일상"
+
+    def test_soa_input_matches_list_input(self):
+        items = [{"title": f"game {i}", "views": 100 + i} for i in range(30)]
+        items.append({"title": "cooking", "views": 50000})
+        soa = _to_soa(items)
+        assert topic_cluster(soa) == topic_cluster(items)
+        assert detect_spike(soa) == detect_spike(items)
+
+
+class TestSampleData:
+    """Tests for sample data fallback generators."""
+
+    def test_seeded_samples_are_deterministic(self):
+        seed_sample_rng(42)
+        first = _get_sample_youtube_data("KR")
+        seed_sample_rng(42)
+        second = _get_sample_youtube_data("KR")
+        assert [v["views"] for v in first] == [v["views"] for v in second]
+        assert len(first) == 20
+
+    def test_sample_fields_are_plain_ints(self):
+        videos = _get_sample_tiktok_data("KR")
+        assert all(type(v["views"]) is int for v in videos)
+        assert all(0 < v["likes"] < v["views"] for v in videos)
+        assert videos[0]["video_id"] == "TT_000"
+
+    def test_published_at_is_iso_string_in_window(self):
+        from datetime import datetime, timedelta
+
+        now = datetime.now()
+        for v in _get_sample_youtube_data("KR"):
+            published = datetime.fromisoformat(v["published_at"])
+            assert now - timedelta(hours=49) <= published <= now
+
+
 class TestReportNode:
     """Tests for report_node."""
 
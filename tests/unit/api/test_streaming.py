@@ -0,0 +1,92 @@
+"""
+Tests for SSE streaming helpers.
+"""
+
+import orjson
+import pytest
+
+from src.api.streaming import StreamEvent, TaskStreamManager
+
+
+class TestStreamEvent:
+    """Test SSE frame serialization."""
+
+    def test_to_sse_matches_to_dict(self):
+        """Templated envelope encodes the same JSON as to_dict()."""
+        event = StreamEvent(event="node_complete", data={"node": "수집", 1: [1.5, None]})
+        frame = event.to_sse()
+
+        header, body = frame.split(b"\ndata: ", 1)
+        assert header == b"event: node_complete"
+        assert body.endswith(b"\n\n")
+        assert orjson.loads(body) == orjson.loads(
+            orjson.dumps(event.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+        )
+        # 프레임은 한 번만 인코딩되고 리플레이 시 재사용
+        assert event.to_sse() is frame
+
+    def test_encode_uses_custom_serializer(self):
+        """encode() defaults to JSON and accepts a pluggable serializer."""
+        event = StreamEvent(event="started", data={"query": "ai"}, timestamp=1.0)
+        assert orjson.loads(event.encode()) == event.to_dict()
+        assert event.encode(serializer=lambda d: repr(d).encode()) == repr(event.to_dict()).encode()
+
+
+class TestTaskStreamManager:
+    """Test TaskStreamManager history handling."""
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self):
+        """Only the most recent history_limit events are kept for replay."""
+        manager = TaskStreamManager(history_limit=3)
+        for i in range(5):
+            await manager.emit("t1", StreamEvent(event="node_complete", data={"i": i}))
+
+        replayed = [e.data["i"] for e in manager._history["t1"]]
+        assert replayed == [2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_threadsafe_emitter_coalesces_in_order(self):
+        """Events from a worker thread arrive in order via batched emit_many()."""
+        import asyncio
+
+        from src.agents import stream_utils
+
+        loop = asyncio.get_running_loop()
+        emitter = stream_utils._make_threadsafe_emitter("t2", loop)
+
+        def _worker():
+            for i in range(20):
+                emitter(StreamEvent(event="node_complete", data={"i": i}))
+
+        await loop.run_in_executor(None, _worker)
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        history = stream_utils.stream_manager._history["t2"]
+        assert [e.data["i"] for e in history] == list(range(20))
+
+    @pytest.mark.asyncio
+    async def test_subscribe_batches_groups_replay_and_backlog(self):
+        """History replays as one batch; queued live events are drained together."""
+        import asyncio
+
+        manager = TaskStreamManager()
+        await manager.emit("t3", StreamEvent(event="started", data={}))
+        await manager.emit("t3", StreamEvent(event="node_complete", data={"i": 0}))
+
+        batches = manager.subscribe_batches("t3")
+        assert [e.event for e in await batches.__anext__()] == ["started", "node_complete"]
+
+        pending = asyncio.ensure_future(batches.__anext__())
+        await asyncio.sleep(0)
+        await manager.emit_many(
+            "t3",
+            [
+                StreamEvent(event="node_complete", data={"i": 1}),
+                StreamEvent(event="complete", data={}),
+            ],
+        )
+        assert [e.event for e in await pending] == ["node_complete", "complete"]
+        with pytest.raises(StopAsyncIteration):
+            await batches.__anext__()
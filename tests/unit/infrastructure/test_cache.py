@@ -66,6 +66,20 @@ class TestSimpleCache:
         cache.clear()
         assert cache.size() == 0
 
+    def test_max_size_evicts_least_recently_used(self):
+        """Test LRU eviction when max_size is set."""
+        from src.infrastructure.cache import SimpleCache
+
+        cache = SimpleCache(default_ttl=60, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.size() == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+
     def test_complex_values(self, cache):
         """Test caching complex Python objects."""
         complex_value = {"list": [1, 2, 3], "dict": {"nested": True}, "tuple": (1, 2)}
@@ -159,6 +173,27 @@ class TestCachedDecorator:
         assert result3 == 20
         assert call_count == 2
 
+    def test_callable_ttl(self):
+        """Test TTL computed from call arguments."""
+        from src.infrastructure.cache import cached
+
+        call_count = 0
+
+        @cached(ttl=lambda window: 0 if window == "live" else 60)
+        def fetch_window(window):
+            nonlocal call_count
+            call_count += 1
+            return window
+
+        fetch_window("7d")
+        fetch_window("7d")
+        assert call_count == 1
+
+        fetch_window("live")
+        time.sleep(0.01)
+        fetch_window("live")
+        assert call_count == 3  # ttl=0 expires immediately
+
     def test_cache_clear(self):
         """Test clearing function cache."""
         from src.infrastructure.cache import cached
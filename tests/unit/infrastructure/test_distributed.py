@@ -0,0 +1,38 @@
+"""
+Unit tests for the distributed agent executor.
+"""
+
+import pytest
+
+from src.infrastructure.distributed import DistributedAgentExecutor, TaskStatus
+
+
+class TestResultCache:
+    """Test reuse of completed results for repeated requests."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_skips_agent(self):
+        """The same (agent, query, params) is served from the cache; other params still run."""
+        calls = []
+
+        async def agent(agent_name, query, params, task_id=None):
+            calls.append(query)
+            return {"query": query, "n": len(calls)}
+
+        executor = DistributedAgentExecutor(
+            num_workers=1, agent_executor=agent, result_cache_ttl=60
+        )
+        await executor.start()
+        try:
+            first = await executor.submit_task("news_trend_agent", "AI", {"a": 1, "b": 2})
+            assert await executor.wait_for_result(first, timeout=5) == {"query": "AI", "n": 1}
+
+            again = await executor.submit_task("news_trend_agent", "AI", {"b": 2, "a": 1})
+            assert await executor.get_task_status(again) == TaskStatus.COMPLETED
+            assert await executor.wait_for_result(again, timeout=5) == {"query": "AI", "n": 1}
+
+            other = await executor.submit_task("news_trend_agent", "AI", {"a": 2})
+            assert (await executor.wait_for_result(other, timeout=5))["n"] == 2
+        finally:
+            await executor.stop()
+        assert calls == ["AI", "AI"]
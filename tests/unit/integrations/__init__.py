@@ -0,0 +1 @@
+"""Integration layer unit tests."""
@@ -0,0 +1,22 @@
+"""
+Tests for the unified LLM client factory.
+"""
+
+from src.integrations.llm.llm_client import get_llm_client, reset_llm_clients
+
+
+class TestGetLLMClient:
+    """Test per-provider client caching."""
+
+    def test_clients_are_cached_per_provider(self):
+        """Switching providers reuses each provider's client instead of rebuilding it."""
+        reset_llm_clients()
+        try:
+            ollama = get_llm_client("ollama")
+            groq = get_llm_client("groq")
+
+            assert get_llm_client() is groq
+            assert get_llm_client("ollama") is ollama
+            assert get_llm_client() is ollama
+        finally:
+            reset_llm_clients()
@@ -0,0 +1,226 @@
+"""
+Tests for the stdio MCP client and its process pool.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+from src.integrations.mcp.loop_thread import AsyncLoopThread
+from src.integrations.mcp.servers.mcp_client import (
+    MCPClient,
+    MCPClientManager,
+    MCPClientPool,
+    ToolDef,
+)
+
+# Minimal JSON-RPC stdio server: answers every request, tools/call returns its pid,
+# tools/list counts how often it was asked, the "notify" tool announces list_changed
+FAKE_SERVER = r"""
+import json, os, sys
+lists = 0
+for line in sys.stdin:
+    msg = json.loads(line)
+    if "id" not in msg:
+        continue
+    if msg["method"] == "tools/call":
+        if msg["params"]["name"] == "notify":
+            note = {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"}
+            sys.stdout.write(json.dumps(note) + "\n")
+        text = json.dumps({"pid": os.getpid(), "args": msg["params"]["arguments"]})
+        result = {"content": [{"type": "text", "text": text}]}
+    elif msg["method"] == "tools/list":
+        lists += 1
+        result = {"tools": [{"name": "echo", "description": str(lists)}]}
+    else:
+        result = {}
+    sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": msg["id"], "result": result}) + "\n")
+    sys.stdout.flush()
+"""
+
+
+def _fake_client() -> MCPClient:
+    return MCPClient(name="fake", command=sys.executable, args=["-c", FAKE_SERVER])
+
+
+class TestMCPClient:
+    """Test single-server client behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_tool_list_cached_until_list_changed(self):
+        """tools/list is sent once per process until the server announces a change."""
+        client = _fake_client()
+        try:
+            first = await client.list_tools()
+            assert await client.list_tools() == first == [ToolDef("echo", "1", {})]
+            assert first[0]._asdict() == {"name": "echo", "description": "1", "inputSchema": {}}
+
+            await client.call_tool("notify")
+            assert (await client.list_tools())[0].description == "2"
+        finally:
+            await client.stop()
+
+
+class TestMCPClientPool:
+    """Test MCPClientPool reuse and expiry."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_started_process(self):
+        """Sequential calls share one server process."""
+        pool = MCPClientPool()
+        try:
+            async with pool.acquire(_fake_client()) as c:
+                first = await c.call_tool("echo", {"n": 1})
+            async with pool.acquire(_fake_client()) as c:
+                second = await c.call_tool("echo", {"n": 2})
+
+            assert first["pid"] == second["pid"]
+            assert second["args"] == {"n": 2}
+            assert pool.size() == 1
+        finally:
+            await pool.close_all()
+        assert pool.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_client_is_replaced(self):
+        """Idle clients older than idle_ttl are not reused."""
+        pool = MCPClientPool(idle_ttl=0.0)
+        try:
+            async with pool.acquire(_fake_client()) as c:
+                first = await c.call_tool("echo", {})
+            async with pool.acquire(_fake_client()) as c:
+                second = await c.call_tool("echo", {})
+
+            assert first["pid"] != second["pid"]
+        finally:
+            await pool.close_all()
+
+
+class TestAsyncLoopThread:
+    """Test the shared MCP event loop thread."""
+
+    def test_sync_calls_share_pooled_process(self):
+        """Sync callers reuse one loop, so pooled servers survive between calls."""
+        loop_thread = AsyncLoopThread(name="test-mcp-loop")
+        pool = MCPClientPool()
+
+        async def _call(n):
+            async with pool.acquire(_fake_client()) as c:
+                return await c.call_tool("echo", {"n": n})
+
+        try:
+            first = loop_thread.run(_call(1), timeout=10)
+            second = loop_thread.run(_call(2), timeout=10)
+            assert first["pid"] == second["pid"]
+        finally:
+            loop_thread.run(pool.close_all(), timeout=10)
+            loop_thread.stop()
+
+    def test_blocking_from_inside_loop_raises(self):
+        """Blocking on the shared loop from its own thread would deadlock."""
+        loop_thread = AsyncLoopThread(name="test-mcp-loop")
+
+        async def _nested():
+            async def _noop():
+                return None
+
+            coro = _noop()
+            try:
+                loop_thread.submit(coro)
+            finally:
+                coro.close()
+
+        try:
+            with pytest.raises(RuntimeError):
+                loop_thread.run(_nested(), timeout=10)
+        finally:
+            loop_thread.stop()
+
+
+class TestMCPClientManager:
+    """Test multi-server session startup."""
+
+    def _manager(self, tmp_path, servers):
+        config = tmp_path / "mcp_config.json"
+        config.write_text(json.dumps({"mcpServers": servers}))
+        return MCPClientManager(config_path=config)
+
+    @pytest.mark.asyncio
+    async def test_session_starts_servers_concurrently(self, tmp_path):
+        """All requested servers are started and stopped together."""
+        server = {"command": sys.executable, "args": ["-c", FAKE_SERVER]}
+        manager = self._manager(tmp_path, {"a": server, "b": server})
+
+        async with manager.session("a", "b") as clients:
+            assert set(clients) == {"a", "b"}
+            pids = {(await c.call_tool("echo", {}))["pid"] for c in clients.values()}
+            assert len(pids) == 2
+
+        assert not any(c.is_running for c in clients.values())
+
+    @pytest.mark.asyncio
+    async def test_start_session_outlives_caller_scope(self, tmp_path):
+        """start_session() hands ownership to the caller until the stack is closed."""
+        server = {"command": sys.executable, "args": ["-c", FAKE_SERVER]}
+        manager = self._manager(tmp_path, {"a": server})
+
+        clients, stack = await manager.start_session("a")
+        assert clients["a"].is_running
+        assert "pid" in await clients["a"].call_tool("echo", {})
+
+        await stack.aclose()
+        assert not clients["a"].is_running
+
+    @pytest.mark.asyncio
+    async def test_session_retries_slow_initialize(self, tmp_path):
+        """A server that hangs on its first initialize is retried."""
+        marker = tmp_path / "started-once"
+        script = (
+            "import os, sys, time\n"
+            f"marker = {str(marker)!r}\n"
+            "if not os.path.exists(marker):\n"
+            "    open(marker, 'w').close()\n"
+            "    time.sleep(30)\n"
+        ) + FAKE_SERVER
+        server = {"command": sys.executable, "args": ["-c", script]}
+        manager = self._manager(tmp_path, {"slow": server})
+
+        async with manager.session("slow", init_timeout=2.0, init_retries=2) as clients:
+            assert "pid" in await clients["slow"].call_tool("echo", {})
+
+        marker.unlink()
+        with pytest.raises(asyncio.TimeoutError):
+            async with manager.session("slow", init_timeout=2.0, init_retries=1):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_session_start_failure_stops_started_servers(self, tmp_path):
+        """A failing server aborts the session without leaking the others."""
+        good = {"command": sys.executable, "args": ["-c", FAKE_SERVER]}
+        bad = {"command": str(tmp_path / "no-such-binary"), "args": []}
+        manager = self._manager(tmp_path, {"good": good, "bad": bad})
+
+        with pytest.raises(FileNotFoundError):
+            async with manager.session("good", "bad"):
+                pass
+
+        assert not manager.get_client("good").is_running
+
+    def test_config_reloaded_only_when_file_changes(self, tmp_path):
+        """Config parsing is cached until the file's mtime changes."""
+        manager = self._manager(tmp_path, {"a": {"command": "a"}})
+        manager.load_config()
+        config = manager._config
+
+        again = MCPClientManager(config_path=manager.config_path)
+        again.load_config()
+        assert again._config is config
+
+        manager.config_path.write_text(json.dumps({"mcpServers": {"b": {"command": "b"}}}))
+        os.utime(manager.config_path, ns=(0, manager.config_path.stat().st_mtime_ns + 1))
+        changed = MCPClientManager(config_path=manager.config_path)
+        changed.load_config()
+        assert list(changed._config["mcpServers"]) == ["b"]
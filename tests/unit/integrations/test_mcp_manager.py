@@ -0,0 +1,26 @@
+"""
+Tests for the built-in MCP tool manager.
+"""
+
+import pytest
+
+from src.integrations.mcp.mcp_manager import MCPManager
+
+
+class TestHttpSession:
+    """Test shared aiohttp session reuse."""
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_until_closed(self, tmp_path):
+        """Calls share one ClientSession; close() releases it."""
+        manager = MCPManager(config_path=str(tmp_path / "missing.json"))
+
+        first = await manager._get_http_session()
+        assert await manager._get_http_session() is first
+
+        await manager.close()
+        assert first.closed
+
+        second = await manager._get_http_session()
+        assert second is not first
+        await manager.close()